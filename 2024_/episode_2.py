@@ -3,6 +3,9 @@ import numpy as np
 from scipy.special import comb
 from typing import List
 
+from static_layer import static_layer
+from grid_factory import cached_number_plane
+
 class Utils:
     @staticmethod
     def linear_interpolation(A: np.ndarray, B: np.ndarray, t: float) -> np.ndarray:
@@ -111,11 +114,12 @@ class BezierScene(MovingCameraScene):
 
     def construct(self):
         # 设置坐标系
-        grid = NumberPlane(
+        grid = cached_number_plane(
             x_range=(-100, 100),
             y_range=(-100, 100),
             axis_config={"color": BLUE},
-        ).add_coordinates()
+            coordinates=True,
+        )
         
 
         # 初始化控制点
@@ -162,6 +166,8 @@ class BezierScene(MovingCameraScene):
 
 
         self.play(Create(grid))
+        # 坐标网格之后不再变化：作为静态背景只光栅化一次（镜头移动时自动重画）
+        static_layer(self).mark(grid)
 
         # 创建控制点和线段
         control_points_group = self.create_control_points(control_points, labels)
@@ -1,5 +1,7 @@
 from manim import *
 
+from grid_factory import cached_axes
+
 class BezierWeightAnimation(Scene):
     def construct(self):
         # 设置标题
@@ -69,7 +71,7 @@ class BezierWeightAnimation(Scene):
         self.wait(1)
 
         # 曲线图动态变化
-        graph_axes = Axes(
+        graph_axes = cached_axes(
             x_range=[0, 1, 0.1],
             y_range=[0, 1.2, 0.1],
             axis_config={"font_size": 20},
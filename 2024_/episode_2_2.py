@@ -3,6 +3,8 @@ import numpy as np
 from scipy.special import comb
 from typing import List
 
+from grid_factory import cached_axes
+
 class Utils:
     @staticmethod
     def linear_interpolation(A: np.ndarray, B: np.ndarray, t: float) -> np.ndarray:
@@ -86,7 +88,7 @@ class BezierScene(MovingCameraScene):
         lines_group = self.connect_control_points(control_points)
 
         # 设置图形
-        graph_axes = Axes(
+        graph_axes = cached_axes(
             x_range=[0, 1, 0.1],
             y_range=[0, 1.2, 0.1],
             axis_config={"font_size": 20},
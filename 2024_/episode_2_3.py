@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from grid_factory import cached_axes
+
 class BezierDerivativeScene(Scene):
     def create_control_points(self, points: list, labels: list, color=RED) -> VGroup:
         """
@@ -58,7 +60,7 @@ class BezierDerivativeScene(Scene):
 
   
         # 设置坐标系
-        graph_axes = Axes(
+        graph_axes = cached_axes(
             x_range=[0, 1, 0.1],  # t 范围 [0, 1]
             y_range=[0, 10, 2],  # y 值范围（根据计算结果微调）
             axis_config={"font_size": 20},
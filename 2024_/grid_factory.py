@@ -0,0 +1,74 @@
+"""
+Grid factory: build each coordinate system once and hand out copies.
+
+`NumberPlane(x_range=(-10, 10), y_range=(-10, 10)).add_coordinates()` is
+rebuilt by most Bezier scenes, and every build lays out dozens of
+`DecimalNumber` tick labels (a MathTex and SVG parse each) from scratch.
+The factory keys each fully built plane or axes by (class, kwargs, whether
+coordinates were added, frame size, Manim version), keeps the prototypes in
+memory and pickles them to disk, so later scenes and later renders only pay
+for a copy. The frame size is part of the key because Axes and NumberPlane
+derive their default `x_length` / `y_length` from it.
+
+    from grid_factory import cached_number_plane, cached_axes
+    grid = cached_number_plane(x_range=(-10, 10), y_range=(-10, 10),
+                               axis_config={"color": BLUE}, coordinates=True)
+    graph_axes = cached_axes(x_range=[0, 1, 0.1], y_range=[0, 1.2, 0.1], tips=False).scale(0.5)
+
+Positioning (`scale`, `to_edge`, ...) is done on the copy, as before. The
+disk cache lives in `<media_dir>/grid_cache` and is trimmed LRU-first once it
+holds more than `max_files` entries.
+"""
+
+import hashlib
+import os
+import sys
+
+from manim import Axes, NumberPlane, __version__ as manim_version, config
+
+# the pickled LRU store shared with the text atlas lives in the repository-level `shared` package
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.append(REPO_DIR)
+from shared.pickle_cache import PickleCache
+
+
+class GridFactory(PickleCache):
+    def __init__(self, cache_dir=None, max_memory=32, max_files=64):
+        super().__init__(cache_dir, max_memory, max_files)
+
+    @property
+    def cache_dir(self):
+        # resolved lazily so command line options (--media_dir) are honoured
+        return self._cache_dir or os.path.join(config.media_dir, "grid_cache")
+
+    @staticmethod
+    def key(cls, coordinates, kwargs):
+        options = ",".join(f"{name}={kwargs[name]!r}" for name in sorted(kwargs))
+        frame = f"{config.frame_width!r}x{config.frame_height!r}"
+        text = f"{manim_version}\0{cls.__name__}\0{coordinates}\0{frame}\0{options}"
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, cls, coordinates=False, **kwargs):
+        """A fresh copy of `cls(**kwargs)` (with `add_coordinates()` if asked), built at most once."""
+
+        def build():
+            grid = cls(**kwargs)
+            if coordinates:
+                grid.add_coordinates()
+            return grid
+
+        return self.fetch(self.key(cls, coordinates, kwargs), build)
+
+
+default_factory = GridFactory()
+
+
+def cached_number_plane(coordinates=False, **kwargs):
+    """Drop-in for `NumberPlane(**kwargs)`, plus `.add_coordinates()` when `coordinates` is true."""
+    return default_factory.get(NumberPlane, coordinates, **kwargs)
+
+
+def cached_axes(coordinates=False, **kwargs):
+    """Drop-in for `Axes(**kwargs)`, plus `.add_coordinates()` when `coordinates` is true."""
+    return default_factory.get(Axes, coordinates, **kwargs)
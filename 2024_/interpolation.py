@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from static_layer import static_layer
+from grid_factory import cached_number_plane
+
 class Utils(VMobject):
     @staticmethod
     def linear_interpolation(A: Vector, B: Vector, t: float) -> Vector:
@@ -38,11 +41,12 @@ class Utils(VMobject):
 class BezierInterpolationScene(Scene):
     def construct(self):
         # 使用 Axes 作为坐标系
-        grid = NumberPlane(
+        grid = cached_number_plane(
             x_range=(-10, 10),   # 设置 x 轴范围
             y_range=(-10, 10),   # 设置 y 轴范围
             axis_config={"color": BLUE},
-        ).add_coordinates()  # 显示坐标轴上的数值
+            coordinates=True,    # 显示坐标轴上的数值
+        )
 
         self.camera.frame_width = 20
         self.camera.frame_height = 20
@@ -59,6 +63,8 @@ class BezierInterpolationScene(Scene):
         projected_control_points = [grid.coords_to_point(point[0], point[1]) for point in control_points]
 
         self.play(Create(grid))
+        # 坐标网格之后不再变化：作为静态背景只光栅化一次
+        static_layer(self).mark(grid)
         self.wait(1)
 
         # 创建控制点的 Dot 对象（用红色表示原始控制点）
@@ -3,6 +3,9 @@ import numpy as np
 from scipy.special import comb
 from typing import List
 
+from static_layer import static_layer
+from grid_factory import cached_number_plane
+
 
 class Utils(VMobject):
     @staticmethod
@@ -88,11 +91,12 @@ class BezierPath(VMobject):
 class BezierScene(Scene):
     def construct(self):
         # 使用 Axes 作为坐标系
-        grid = NumberPlane(
+        grid = cached_number_plane(
             x_range=(-10, 10),   # 设置 x 轴范围
             y_range=(-10, 10),   # 设置 y 轴范围
             axis_config={"color": BLUE},
-        ).add_coordinates()  # 显示坐标轴上的数值
+            coordinates=True,    # 显示坐标轴上的数值
+        )
         
 
         interpolation_demo_points = [
@@ -136,6 +140,9 @@ class BezierScene(Scene):
         interpolation_intro.to_edge(UP)
         interpolation_intro.set_stroke(BLACK, 10, background=True)
         self.play(Create(grid), FadeTransform(intro_words_1, interpolation_intro))
+        # 坐标网格放到最底层，之后不再变化：作为静态背景只光栅化一次
+        self.bring_to_back(grid)
+        static_layer(self).mark(grid)
         self.wait(3)
 
 
@@ -0,0 +1,139 @@
+"""
+Static background layer for the Cairo renderer.
+
+Manim already rasterizes the non-moving mobjects once per `play` into a
+static image and draws only the moving ones on top of it each frame, but it
+redoes that for every `play` and `wait`, and a frozen-frame `wait` then
+draws the whole scene a second time over it. A 400-step `self.wait(0.03)`
+loop therefore rasterizes a full `NumberPlane(...).add_coordinates()` about
+800 times although it never changes.
+
+Marking mobjects as static keeps their rasterized pixels across calls:
+
+    grid = NumberPlane(...).add_coordinates()
+    self.play(Create(grid))
+    static_layer(self).mark(grid)
+
+Before each `play`/`wait`, the static mobjects at the bottom of the scene
+(those drawn before anything else) are fingerprinted by their point and
+style arrays and the camera frame. An unchanged fingerprint reuses the
+cached pixels; any change (moving, recolouring, zooming the camera)
+rasterizes the layer once more. Marked mobjects that are being animated,
+or that have something unmarked beneath them, are simply drawn as usual.
+"""
+
+import collections
+import hashlib
+import itertools
+
+import numpy as np
+
+SIMPLE_TYPES = (bool, int, float, str, type(None))
+
+
+def fingerprint(mobjects, camera):
+    """Digest of everything that affects how `mobjects` rasterize through `camera`."""
+    digest = hashlib.blake2b(digest_size=16)
+    for mob in mobjects:
+        digest.update(id(mob).to_bytes(8, "little"))
+        for name, value in vars(mob).items():
+            if isinstance(value, np.ndarray):
+                if not value.dtype.hasobject:
+                    digest.update(name.encode())
+                    digest.update(str(value.shape).encode())
+                    digest.update(np.ascontiguousarray(value).data)
+            elif isinstance(value, SIMPLE_TYPES):
+                digest.update(f"{name}={value!r}".encode())
+    digest.update(repr((
+        camera.pixel_width, camera.pixel_height, camera.frame_width, camera.frame_height,
+        tuple(np.round(camera.frame_center, 9)), str(camera.background_color), camera.background_opacity,
+    )).encode())
+    return digest.digest()
+
+
+class StaticLayer:
+    """
+    Keeps the rasterized static bottom layer of one scene across `play` calls.
+    Installed on the scene's renderer by `static_layer(scene)`; renderers
+    without a static image (OpenGL) are left alone.
+    """
+
+    def __init__(self, scene, cache_size=2):
+        self.scene = scene
+        self.renderer = scene.renderer
+        self.cache_size = cache_size
+        self.marked = []
+        self.layers = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # True while the current play has no moving mobjects, so the static image is the whole frame
+        self.frame_is_static = False
+
+        renderer = self.renderer
+        self.enabled = hasattr(renderer, "save_static_frame_data")
+        if self.enabled:
+            self._save_static_frame_data = renderer.save_static_frame_data
+            self._update_frame = renderer.update_frame
+            self._play = renderer.play
+            renderer.save_static_frame_data = self.save_static_frame_data
+            renderer.update_frame = self.update_frame
+            renderer.play = self.play
+
+    def mark(self, *mobjects):
+        """Treat `mobjects` as unchanging background; they should sit below everything else."""
+        self.marked.extend(m for m in mobjects if m not in self.marked)
+        return self
+
+    def unmark(self, *mobjects):
+        self.marked = [m for m in self.marked if m not in mobjects]
+        return self
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.frame_is_static = False
+        marked = {id(m) for root in self.marked for m in root.get_family()}
+        # static_mobjects is in drawing order, so a marked prefix is a layer nothing is drawn under
+        layer_mobjects = list(itertools.takewhile(lambda m: id(m) in marked, static_mobjects))
+        if not layer_mobjects:
+            return self._save_static_frame_data(scene, static_mobjects)
+
+        key = fingerprint(layer_mobjects, self.renderer.camera)
+        layer = self.layers.get(key)
+        if layer is None:
+            self.misses += 1
+            layer = self._save_static_frame_data(scene, layer_mobjects)
+            self.layers[key] = layer
+            while len(self.layers) > self.cache_size:
+                self.layers.popitem(last=False)
+        else:
+            self.hits += 1
+            self.layers.move_to_end(key)
+
+        # the rest of the static mobjects go over the cached layer, once per play as before
+        self.renderer.static_image = layer
+        rest = static_mobjects[len(layer_mobjects):]
+        if rest:
+            self._update_frame(scene, mobjects=rest)
+            self.renderer.static_image = self.renderer.get_frame()
+        self.frame_is_static = not scene.moving_mobjects
+        return self.renderer.static_image
+
+    def update_frame(self, scene, mobjects=None, *args, **kwargs):
+        if not mobjects and self.frame_is_static and self.renderer.static_image is not None:
+            # frozen frame: the static image already holds every mobject, no need to draw them again
+            self.renderer.camera.set_frame_to_background(self.renderer.static_image)
+            return
+        return self._update_frame(scene, mobjects, *args, **kwargs)
+
+    def play(self, scene, *args, **kwargs):
+        try:
+            return self._play(scene, *args, **kwargs)
+        finally:
+            self.frame_is_static = False
+
+
+def static_layer(scene, cache_size=2):
+    """The scene's StaticLayer, installed on first use."""
+    layer = getattr(scene, "_static_layer", None)
+    if layer is None:
+        layer = scene._static_layer = StaticLayer(scene, cache_size)
+    return layer
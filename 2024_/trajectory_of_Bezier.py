@@ -1,13 +1,16 @@
 from manim import *
 
+from grid_factory import cached_number_plane
+
 class CoordsToPointExample(Scene):
     def construct(self):
        # 使用 Axes 作为坐标系
-        grid = NumberPlane(
+        grid = cached_number_plane(
             x_range=(-5, 5),   # 设置 x 轴范围
             y_range=(-5, 5),   # 设置 y 轴范围
             axis_config={"color": BLUE},
-        ).add_coordinates()  # 显示坐标轴上的数值
+            coordinates=True,  # 显示坐标轴上的数值
+        )
 
 
         intro_words = Text("""
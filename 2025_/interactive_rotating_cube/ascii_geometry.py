@@ -0,0 +1,79 @@
+"""
+Sampled surfaces for the point-cloud ASCII renderers.
+
+A primitive's sample points, normals and characters depend only on its size
+and sampling step, so they are built once per parameter set and cached;
+each frame then only rotates them. The cached arrays are read-only because
+they are shared by every caller.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Luminance ramp, darkest to brightest (same as rotation_donut.cc)
+LUMINANCE = np.frombuffer(b".,-~:;=!*#$@", dtype=np.uint8)
+
+
+class SurfaceGeometry(NamedTuple):
+    points: np.ndarray             # (N, 3) samples
+    normals: np.ndarray            # (N, 3) unit outward normals
+    chars: Optional[np.ndarray]    # (N,) characters for unshaded drawing, or None
+
+
+def _freeze(*arrays):
+    for array in arrays:
+        if array is not None:
+            array.flags.writeable = False
+
+
+@lru_cache(maxsize=8)
+def cube_geometry(cube_width, step):
+    """
+    Samples of the six faces of a cube of half-size `cube_width`, `step` apart,
+    with each face's character ('@$~#;+'). Samples are ordered like the six
+    calculate_plane calls per (cube_x, cube_y) pair in rotation_cube.py, so
+    depth ties are resolved the same way.
+    """
+    coords = np.arange(-cube_width, cube_width, step)
+    cube_x, cube_y = (c.ravel() for c in np.meshgrid(coords, coords, indexing="ij"))
+    w = np.full_like(cube_x, cube_width)
+    points = np.stack([
+        np.stack([cube_x, cube_y, -w], axis=1),   # Front face
+        np.stack([w, cube_y, cube_x], axis=1),    # Right face
+        np.stack([-w, cube_y, -cube_x], axis=1),  # Left face
+        np.stack([-cube_x, cube_y, w], axis=1),   # Back face
+        np.stack([cube_x, -w, -cube_y], axis=1),  # Bottom face
+        np.stack([cube_x, w, cube_y], axis=1),    # Top face
+    ], axis=1).reshape(-1, 3)
+    face_normals = np.array([[0, 0, -1], [1, 0, 0], [-1, 0, 0], [0, 0, 1], [0, -1, 0], [0, 1, 0]], dtype=float)
+    normals = np.tile(face_normals, (cube_x.size, 1))
+    chars = np.tile(np.array(['@', '$', '~', '#', ';', '+']), cube_x.size)
+    _freeze(points, normals, chars)
+    return SurfaceGeometry(points, normals, chars)
+
+
+@lru_cache(maxsize=8)
+def torus_geometry(theta_step=0.07, phi_step=0.02, tube_radius=1.0, ring_radius=2.0):
+    """
+    Samples of a torus around the z axis, θ around the tube and φ around the
+    axis, in the loop order of rotation_donut.cc (θ outer, φ inner).
+    """
+    theta, phi = np.meshgrid(np.arange(0, 6.28, theta_step), np.arange(0, 6.28, phi_step), indexing="ij")
+    theta, phi = theta.ravel(), phi.ravel()
+    circle = ring_radius + tube_radius * np.cos(theta)
+    points = np.stack([circle * np.cos(phi), -circle * np.sin(phi), tube_radius * np.sin(theta)], axis=1)
+    normals = np.stack([np.cos(theta) * np.cos(phi), -np.cos(theta) * np.sin(phi), np.sin(theta)], axis=1)
+    _freeze(points, normals)
+    return SurfaceGeometry(points, normals, None)
+
+
+def shade(normals, light):
+    """
+    Ramp characters (uint8) for view-space normals lit from direction `light`
+    (pointing towards the light). Surfaces facing away get the darkest step.
+    """
+    light = np.asarray(light, dtype=float) / np.linalg.norm(light)
+    brightness = np.clip(normals @ light, 0, 1)
+    return LUMINANCE[(brightness * (len(LUMINANCE) - 1) + 0.5).astype(int)]
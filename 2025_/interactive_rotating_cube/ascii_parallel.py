@@ -0,0 +1,178 @@
+"""
+Tile-parallel z-buffer rasterization for the ASCII renderers.
+
+The point cloud is cut into one contiguous tile per worker. Each worker
+rotates and projects its tile and resolves depth into its own row of a
+(workers, cells) z-buffer and winning-sample buffer; the rows are then
+merged by a single argmax over the worker axis. Tiles are in sample order and
+argmax returns the first maximum, so depth ties still go to the earliest
+sample and the result is identical to the single-core `resolve_depth` path.
+Choosing characters (face symbols or shading) is left to the caller, as
+after `resolve_depth`.
+
+With processes the samples and the row buffers live in
+`multiprocessing.shared_memory`: workers write their rows in place and per
+frame only the rotation matrix and a few integers cross the process
+boundary. With threads the same code runs on plain arrays (NumPy releases
+the GIL in the heavy parts, but processes scale further).
+
+    python rotation_cube.py --size 400 150 --workers 8
+"""
+
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ascii_raster import resolve_depth
+
+# Shared buffers, in the order they are passed to the workers
+ROLES = ("points", "depth", "winners")
+
+# Worker-side attachments, one per buffer role: role -> (name, SharedMemory, array)
+_attached = {}
+
+
+def _create(shape, dtype):
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    return shm, np.ndarray(shape, dtype, buffer=shm.buf)
+
+
+def _attach(role, spec):
+    """Array for a (name, shape, dtype) spec, reusing the mapping while the name is unchanged."""
+    name, shape, dtype = spec
+    if role in _attached and _attached[role][0] != name:
+        shm = _attached.pop(role)[1]
+        shm.close()
+    if role not in _attached:
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[role] = (name, shm, np.ndarray(shape, dtype, buffer=shm.buf))
+    return _attached[role][2]
+
+
+def _ignore_interrupt():
+    # Ctrl-C is handled by the render loop, which then shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _render_tile(project, args, R, start, stop, row, arrays):
+    """Resolve depth for samples [start, stop) into row `row` of the depth and winner buffers."""
+    if isinstance(arrays[0], tuple):
+        arrays = [_attach(role, spec) for role, spec in enumerate(arrays)]
+    points, depth, out = arrays
+
+    idx, ooz = project(points[start:stop] @ R.T, *args)
+    cells, winners = resolve_depth(idx, ooz, depth.shape[1])
+    depth[row].fill(0)
+    depth[row, cells] = ooz[winners]
+    out[row, cells] = start + winners
+
+
+class ParallelRasterizer:
+    """
+    Point-cloud z-buffer that spreads the samples over a worker pool.
+
+    `project(rotated, *args)` maps rotated (N, 3) samples to their flat screen
+    cell and 1/z (see rotation_cube.project_points); with processes it must be
+    a module-level function so it can be pickled. Call `set_points` with the
+    samples and `render` once per frame.
+    """
+
+    def __init__(self, project, width, height, workers=None, processes=True):
+        self.project = project
+        self.width = width
+        self.height = height
+        self.workers = workers or os.cpu_count() or 1
+        self.processes = processes and self.workers > 1
+        self.count = 0
+        self._source = None
+
+        # role -> (SharedMemory or None, array); rows of depth/winners belong to one worker each
+        self._arrays = {}
+        self._allocate("depth", (self.workers, width * height), float)
+        self._allocate("winners", (self.workers, width * height), np.int64)
+        self._columns = np.arange(width * height)
+        self._pool = None
+
+    def _allocate(self, role, shape, dtype):
+        self._release(role)
+        if self.processes:
+            shm, array = _create(shape, dtype)
+        else:
+            shm, array = None, np.zeros(shape, dtype)
+        self._arrays[role] = (shm, array)
+        return array
+
+    def _release(self, role):
+        if role in self._arrays:
+            shm = self._arrays.pop(role)[0]
+            if shm is not None:
+                # the array view is gone with the dict entry, so the mapping can close
+                shm.close()
+                shm.unlink()
+
+    def set_points(self, points):
+        """Load (N, 3) samples; N may change between calls. Passing the same array again is free."""
+        if points is self._source:
+            return
+        n = len(points)
+        if "points" not in self._arrays or len(self._arrays["points"][1]) < n:
+            # grow to the next power of two so a slowly changing sample count rarely reallocates
+            capacity = 1 << max(0, n - 1).bit_length()
+            self._allocate("points", (capacity, 3), float)
+        self._arrays["points"][1][:n] = points
+        self.count = n
+        self._source = points
+
+    def _pool_map(self, jobs):
+        if self.workers == 1:
+            for job in jobs:
+                _render_tile(*job)
+            return
+        if self._pool is None:
+            if self.processes:
+                self._pool = ProcessPoolExecutor(self.workers, initializer=_ignore_interrupt)
+            else:
+                self._pool = ThreadPoolExecutor(self.workers)
+        for future in [self._pool.submit(_render_tile, *job) for job in jobs]:
+            future.result()
+
+    def render(self, R, *args):
+        """
+        Z-buffer of the samples rotated by R. Returns (cells, winners, depth):
+        the covered cells, the nearest sample of each and its 1/z.
+        """
+        if self.processes:
+            arrays = [(shm.name, array.shape, array.dtype.str)
+                      for shm, array in (self._arrays[role] for role in ROLES)]
+        else:
+            arrays = [self._arrays[role][1] for role in ROLES]
+
+        bounds = np.linspace(0, self.count, self.workers + 1).astype(int)
+        R = np.asarray(R, dtype=float)
+        self._pool_map([(self.project, args, R, bounds[k], bounds[k + 1], k, arrays)
+                        for k in range(self.workers)])
+
+        # Merge the worker rows: nearest sample per cell, lowest row (earliest tile) on ties
+        depth, winners = self._arrays["depth"][1], self._arrays["winners"][1]
+        best = depth.argmax(axis=0)
+        nearest = depth[best, self._columns]
+        cells = np.flatnonzero(nearest > 0)
+        return cells, winners[best[cells], cells], nearest[cells]
+
+    def close(self):
+        # unlink first: workers keep their mappings, and nothing leaks if shutdown is interrupted
+        for role in list(self._arrays):
+            self._release(role)
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
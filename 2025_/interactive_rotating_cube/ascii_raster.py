@@ -0,0 +1,17 @@
+import numpy as np
+
+
+def resolve_depth(idx, depth, size):
+    """
+    Z-buffer resolution for a whole point cloud at once.
+
+    `idx` is the flat screen cell of every sample and `depth` its 1/z (larger
+    is nearer). Samples outside [0, size) or with depth <= 0 are dropped.
+    Returns (cells, winners): the covered cells and, for each, the index of
+    the nearest sample; on equal depth the earliest sample wins, matching a
+    sequential `if depth > z_buffer[idx]` loop.
+    """
+    visible = np.flatnonzero((idx >= 0) & (idx < size) & (depth > 0))
+    order = visible[np.lexsort((visible, -depth[visible], idx[visible]))]
+    cells, first = np.unique(idx[order], return_index=True)
+    return cells, order[first]
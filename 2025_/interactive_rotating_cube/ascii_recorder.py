@@ -0,0 +1,152 @@
+"""
+Record and replay the terminal renderers as asciicast v2 files.
+
+`AsciicastRecorder` is a drop-in output stream for `TerminalPresenter`: every
+write becomes one timestamped event appended to the file straight away, so a
+recording of any length needs no more memory than one frame. Recording from a
+presenter in diff mode stores only the changed cells of each frame. Files
+ending in `.gz` are gzip-compressed; plain `.cast` files play in asciinema.
+
+    python rotation_cube.py --diff --record cube.cast
+    python ascii_recorder.py cube.cast --speed 2
+"""
+
+import gzip
+import json
+import re
+import sys
+import time
+
+import numpy as np
+
+
+def _open(path, mode):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class AsciicastRecorder:
+    """Binary stream that timestamps everything written to it into an asciicast file."""
+
+    def __init__(self, path, width, height, tee=None, flush_interval=1.0, title=None):
+        self.path = path
+        self.tee = tee
+        self.flush_interval = flush_interval
+        self.events = 0
+        self._file = _open(path, "w")
+        header = {"version": 2, "width": width, "height": height, "timestamp": int(time.time())}
+        if title:
+            header["title"] = title
+        self._file.write(json.dumps(header) + "\n")
+        self._start = time.perf_counter()
+        self._last_flush = self._start
+
+    def write(self, data):
+        now = time.perf_counter()
+        text = data.decode("utf-8", errors="replace")
+        self._file.write(json.dumps([round(now - self._start, 6), "o", text]) + "\n")
+        self.events += 1
+        if now - self._last_flush >= self.flush_interval:
+            self._file.flush()
+            self._last_flush = now
+        if self.tee is not None:
+            self.tee.write(data)
+        return len(data)
+
+    def flush(self):
+        if self.tee is not None:
+            self.tee.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_cast(path):
+    """(header, iterator of (time, data)) without loading the whole file."""
+    fp = _open(path, "r")
+    header = json.loads(fp.readline())
+
+    def events():
+        with fp:
+            for line in fp:
+                if line.strip():
+                    t, kind, data = json.loads(line)
+                    if kind == "o":
+                        yield t, data
+    return header, events()
+
+
+def play(path, speed=1.0, stream=None):
+    """Replay a recording with its original timing (scaled by `speed`)."""
+    stream = stream or sys.stdout
+    _, events = read_cast(path)
+    start = time.perf_counter()
+    for t, data in events:
+        # schedule against the start time so sleep errors do not accumulate
+        delay = start + t / speed - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        stream.write(data)
+        stream.flush()
+
+
+# Escape sequences produced by TerminalPresenter
+_ESCAPE = re.compile(r"\x1b\[(?:(\d+);(\d+)H|H|2J|K|\?25[lh])")
+
+
+def screens(path):
+    """
+    Rebuild the screen after every event: yields (time, (height, width) array
+    of characters). Understands the subset of escapes TerminalPresenter emits,
+    which is enough to turn a recording into video frames.
+    """
+    header, events = read_cast(path)
+    width, height = header["width"], header["height"]
+    screen = np.full((height + 2, width), " ", dtype="<U1")
+    row = col = 0
+    for t, data in events:
+        pos = 0
+        for match in list(_ESCAPE.finditer(data)) + [None]:
+            text = data[pos:match.start() if match else len(data)]
+            for line_no, chunk in enumerate(text.split("\n")):
+                if line_no:
+                    row, col = row + 1, 0
+                if chunk and row < screen.shape[0]:
+                    chunk = chunk[:width - col]
+                    screen[row, col:col + len(chunk)] = list(chunk)
+                    col += len(chunk)
+            if match is None:
+                break
+            token = match.group(0)
+            if match.group(1):
+                row, col = int(match.group(1)) - 1, int(match.group(2)) - 1
+            elif token == "\x1b[H":
+                row = col = 0
+            elif token == "\x1b[2J":
+                screen[:] = " "
+            elif token == "\x1b[K" and row < screen.shape[0]:
+                screen[row, col:] = " "
+            pos = match.end()
+        yield t, screen[:height].copy()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay an ASCII renderer recording.")
+    parser.add_argument("path", help=".cast or .cast.gz file")
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args()
+    try:
+        play(args.path, args.speed)
+    except KeyboardInterrupt:
+        pass
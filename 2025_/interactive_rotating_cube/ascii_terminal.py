@@ -0,0 +1,94 @@
+import sys
+
+import numpy as np
+
+# ANSI escape sequences
+CLEAR = b"\x1b[2J"
+HOME = b"\x1b[H"
+HIDE_CURSOR = b"\x1b[?25l"
+SHOW_CURSOR = b"\x1b[?25h"
+
+
+class TerminalPresenter:
+    """
+    Writes ASCII frames to the terminal with a single write per frame.
+
+    A frame is a flat character buffer of width * height cells (as used by
+    rotation_cube.py). In diff mode only the cells that changed since the
+    previous frame are sent, each run of changed cells on a row preceded by
+    a cursor move; when most of the frame changed, the full frame is cheaper
+    and is sent instead.
+    """
+
+    def __init__(self, width, height, diff=False, stream=None, full_frame_ratio=0.5):
+        self.width = width
+        self.height = height
+        self.diff = diff
+        self.stream = stream or sys.stdout.buffer
+        self.full_frame_ratio = full_frame_ratio
+        self.previous = None
+        self.bytes_written = 0
+
+    def to_bytes(self, buffer):
+        """(height, width) uint8 view of a character buffer."""
+        cells = np.asarray(buffer)
+        if cells.dtype.kind == "U":
+            cells = cells.astype("S1")
+        return cells.view(np.uint8).reshape(self.height, self.width)
+
+    def full_frame(self, cells):
+        newline = np.full((self.height, 1), ord("\n"), dtype=np.uint8)
+        return HOME + np.hstack([cells, newline]).tobytes()
+
+    def diff_frame(self, cells):
+        changed = np.flatnonzero(cells.ravel() != self.previous.ravel())
+        if changed.size == 0:
+            return b""
+        if changed.size > self.full_frame_ratio * cells.size:
+            return self.full_frame(cells)
+
+        # split the changed cells into runs of consecutive columns on one row
+        rows, cols = np.divmod(changed, self.width)
+        breaks = np.flatnonzero((np.diff(changed) != 1) | (np.diff(rows) != 0)) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [changed.size]))
+
+        flat = cells.ravel()
+        parts = []
+        for start, end in zip(starts, ends):
+            parts.append(b"\x1b[%d;%dH" % (rows[start] + 1, cols[start] + 1))
+            parts.append(flat[changed[start]:changed[end - 1] + 1].tobytes())
+        return b"".join(parts)
+
+    def present(self, buffer, status=b""):
+        """Draw one frame, and optionally a status line below it, in one write."""
+        cells = self.to_bytes(buffer)
+        if self.diff and self.previous is not None:
+            data = self.diff_frame(cells)
+        else:
+            data = self.full_frame(cells)
+        self.previous = cells.copy()
+        if status:
+            data += b"\x1b[%d;1H" % (self.height + 1) + status + b"\x1b[K"
+        self.write(data)
+
+    def write(self, data):
+        if data:
+            self.stream.write(data)
+            self.stream.flush()
+            self.bytes_written += len(data)
+
+    def clear(self):
+        self.previous = None
+        self.write(CLEAR + HOME + HIDE_CURSOR)
+
+    def close(self):
+        # leave the cursor below the last frame and its status line
+        self.write(b"\x1b[%d;1H" % (self.height + 2) + SHOW_CURSOR)
+
+    def __enter__(self):
+        self.clear()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,123 @@
+import math
+import time
+
+
+class FrameGovernor:
+    """
+    Frame pacing for the terminal renderers.
+
+    - Fixed timestep: `advance()` turns the real time elapsed since the last
+      frame into a whole number of simulation steps of `timestep` seconds, so
+      motion speed no longer depends on how fast a machine renders.
+    - Frame pacing: `end_frame()` sleeps until the next frame deadline
+      instead of a fixed delay after however long the frame took.
+    - Adaptive detail: the render time is compared with the frame budget and
+      `sample_step` (the surface sampling step, `increment_speed` in
+      rotation_cube.py) is scaled to bring it back under budget. Render cost
+      grows like sample_step ** -cost_exponent (2 for a surface). The step
+      moves on a geometric ladder `step_ratio` apart from its initial value,
+      so the cached geometry for each rung is reused instead of rebuilt.
+    """
+
+    def __init__(self, target_fps=60.0, timestep=1 / 120, sample_step=0.6, min_step=0.2, max_step=4.0,
+                 adapt=True, cost_exponent=2.0, headroom=0.8, adapt_every=15, max_steps=8,
+                 step_ratio=2 ** 0.25):
+        self.target_fps = target_fps
+        self.frame_period = 1.0 / target_fps
+        self.timestep = timestep
+        self.sample_step = sample_step
+        self.min_step = min_step
+        self.max_step = max_step
+        self.adapt = adapt
+        self.cost_exponent = cost_exponent
+        self.headroom = headroom
+        self.adapt_every = adapt_every
+        self.max_steps = max_steps
+        self.step_ratio = step_ratio
+
+        # sample_step is always base_step * step_ratio ** rung
+        self.base_step = sample_step
+        self.rung = 0
+        self.min_rung = math.ceil(math.log(min_step / sample_step, step_ratio) - 1e-9)
+        self.max_rung = math.floor(math.log(max_step / sample_step, step_ratio) + 1e-9)
+
+        self.frames = 0
+        self.fps = target_fps
+        self.frame_time = self.frame_period
+        self.work_time = 0.0
+        self._accumulator = 0.0
+        self._last = None
+        self._deadline = None
+        self._work_start = None
+        self._work_sum = 0.0
+
+    def advance(self):
+        """Simulation steps to run for the time elapsed since the previous call."""
+        now = time.perf_counter()
+        if self._last is None:
+            self._last = now
+            self._deadline = now
+            return 0
+        elapsed = now - self._last
+        self._last = now
+
+        # exponential moving averages for the HUD
+        self.frame_time += 0.1 * (elapsed - self.frame_time)
+        self.fps = 1.0 / self.frame_time if self.frame_time > 0 else 0.0
+
+        # never fall further behind than max_steps, or a slow frame snowballs
+        self._accumulator = min(self._accumulator + elapsed, self.max_steps * self.timestep)
+        steps = int(self._accumulator / self.timestep)
+        self._accumulator -= steps * self.timestep
+        return steps
+
+    def begin_work(self):
+        self._work_start = time.perf_counter()
+
+    def end_frame(self):
+        """Record the render time, retune the sampling step and wait for the next deadline."""
+        now = time.perf_counter()
+        if self._work_start is not None:
+            work = now - self._work_start
+            self.work_time += 0.1 * (work - self.work_time)
+            self._work_sum += work
+        self.frames += 1
+
+        if self.adapt and self.frames % self.adapt_every == 0:
+            self._retune(self._work_sum / self.adapt_every)
+            self._work_sum = 0.0
+
+        if self._deadline is None:
+            self._deadline = now
+        self._deadline += self.frame_period
+        delay = self._deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # running late: restart the schedule instead of trying to catch up
+            self._deadline = time.perf_counter()
+
+    def _retune(self, average_work):
+        ratio = average_work / (self.headroom * self.frame_period)
+        # only react outside a dead band, so detail does not flicker
+        if 0.7 < ratio < 1.1:
+            return
+        if ratio <= 0:
+            # no measurable work (coarse timer, empty frame): the limit of the formula, the finest rung
+            rung = self.min_rung
+        else:
+            scale = ratio ** (1.0 / self.cost_exponent)
+            rung = self.rung + round(math.log(scale, self.step_ratio))
+        # outside the dead band, always move at least one rung the right way
+        if rung == self.rung:
+            rung += 1 if ratio > 1 else -1
+        rung = min(self.max_rung, max(self.min_rung, rung))
+        if rung != self.rung:
+            self.rung = rung
+            self.sample_step = self.base_step * self.step_ratio ** rung
+
+    def hud(self):
+        return b"FPS %5.1f | frame %6.2f ms | render %6.2f ms | step %.2f%s" % (
+            self.fps, self.frame_time * 1e3, self.work_time * 1e3, self.sample_step,
+            b" (auto)" if self.adapt else b"",
+        )
@@ -1,5 +1,8 @@
 from manim import *
 
+from live_matrix import LiveMatrix
+from rotations import euler_to_matrix
+
 class InteractiveRotationDemo(Scene):
     def construct(self):
         # Title
@@ -37,10 +40,19 @@ class InteractiveRotationDemo(Scene):
         
         self.play(Write(instructions))
         
-        # Animate sliders to show the concept
-        dot_x = Dot().move_to(slider_x.get_left())
-        dot_y = Dot().move_to(slider_y.get_left())
-        dot_z = Dot().move_to(slider_z.get_left())
+        # Rotation angles; the slider dots and the matrix below both follow them
+        alpha, beta, gamma = ValueTracker(0), ValueTracker(0), ValueTracker(0)
+        
+        def slider_dot(slider, tracker):
+            # the slider spans 0 to 90 degrees
+            dot = Dot()
+            dot.add_updater(lambda d: d.move_to(interpolate(
+                slider.get_left(), slider.get_right(), tracker.get_value() / (PI / 2))))
+            return dot
+        
+        dot_x = slider_dot(slider_x, alpha)
+        dot_y = slider_dot(slider_y, beta)
+        dot_z = slider_dot(slider_z, gamma)
         
         self.play(
             Create(dot_x),
@@ -50,11 +62,12 @@ class InteractiveRotationDemo(Scene):
         
         # Animate the dots moving along the sliders
         self.play(
-            dot_x.animate.move_to(slider_x.get_right()),
-            dot_y.animate.move_to(slider_y.get_right()),
-            dot_z.animate.move_to(slider_z.get_right()),
+            alpha.animate.set_value(PI / 2),
+            beta.animate.set_value(PI / 2),
+            gamma.animate.set_value(PI / 2),
             run_time=3
         )
+        self.play(*[tracker.animate.set_value(0) for tracker in (alpha, beta, gamma)])
         
         self.wait()
         
@@ -64,39 +77,22 @@ class InteractiveRotationDemo(Scene):
         matrix_title.to_edge(RIGHT)
         self.play(Write(matrix_title))
         
-        # Display a rotation matrix that updates
-        matrix_text = Text(
-            "[[1, 0, 0],\n [0, 1, 0],\n [0, 0, 1]]", 
+        # Display the rotation matrix R = Rz(γ) · Ry(β) · Rx(α), recomputed every frame
+        matrix = LiveMatrix(
+            (alpha, beta, gamma),
+            lambda a, b, c: euler_to_matrix((a, b, c), "xyz"),
             font_size=24
         ).next_to(matrix_title, DOWN)
-        self.play(Write(matrix_text))
-        
-        # Animate the matrix changing
-        self.play(
-            matrix_text.animate.become(
-                Text(
-                    "[[0.7, 0, 0.7],\n [0, 1, 0],\n [-0.7, 0, 0.7]]", 
-                    font_size=24
-                ).next_to(matrix_title, DOWN)
-            )
-        )
+        self.play(Write(matrix))
         
+        # Animate the angles: the matrix follows the sliders
+        self.play(beta.animate.set_value(PI / 4), run_time=2)
+        self.play(beta.animate.set_value(0), gamma.animate.set_value(PI / 4), run_time=2)
         self.play(
-            matrix_text.animate.become(
-                Text(
-                    "[[0.7, -0.7, 0],\n [0.7, 0.7, 0],\n [0, 0, 1]]", 
-                    font_size=24
-                ).next_to(matrix_title, DOWN)
-            )
-        )
-        
-        self.play(
-            matrix_text.animate.become(
-                Text(
-                    "[[0.5, -0.5, 0.7],\n [0.5, 0.5, 0.7],\n [-0.7, 0, 0.5]]", 
-                    font_size=24
-                ).next_to(matrix_title, DOWN)
-            )
+            alpha.animate.set_value(PI / 6),
+            beta.animate.set_value(PI / 4),
+            gamma.animate.set_value(PI / 3),
+            run_time=3
         )
         
         # Final note
@@ -0,0 +1,138 @@
+"""
+Numeric matrix readout that follows ValueTrackers every frame.
+
+The digits, sign and decimal point are typeset once per font size (through
+the text atlas) and kept as outline templates. Each entry is a row of fixed
+glyph slots; every frame the matrix is recomputed from the trackers, all
+entries are formatted together with integer arithmetic, and only the slots
+whose character changed get a template's points copied in. Nothing is
+re-typeset while the scene plays.
+
+    angles = [ValueTracker(0) for _ in range(3)]
+    readout = LiveMatrix(angles, lambda a, b, c: euler_to_matrix((a, b, c)))
+"""
+
+from manim import *
+import numpy as np
+import os
+import sys
+
+# Shared helpers (text atlas, ...) live one folder up in 2025_/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from text_atlas import cached_text
+
+GLYPHS = "0123456789-."
+BLANK = -1
+
+# (font_size, font) -> (templates, cell_width, cell_height)
+_templates = {}
+
+
+def glyph_templates(font_size=24, font=""):
+    """
+    Outline points of each character in GLYPHS, centred horizontally on 0 and
+    sharing one baseline, plus the cell width and height of a digit.
+    """
+    key = (font_size, font)
+    if key not in _templates:
+        reference = cached_text(GLYPHS, font_size=font_size, font=font)
+        y = reference.get_center()[1]
+        templates = []
+        for glyph in reference:
+            templates.append((glyph.points - [glyph.get_center()[0], y, 0], glyph))
+        cell_width = 1.15 * max(glyph.width for glyph in reference[:10])
+        _templates[key] = (templates, cell_width, reference.height)
+    return _templates[key]
+
+
+class LiveMatrix(VGroup):
+    """
+    Bracketed readout of `func(*tracker_values)`, a (rows, cols) array,
+    refreshed by an updater each frame. Entries are shown with `decimals`
+    decimals and up to `integer_digits` digits before the point.
+    """
+
+    def __init__(self, trackers, func, decimals=2, integer_digits=1, font_size=24, font="",
+                 h_buff=0.3, v_buff=0.2, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.trackers = list(trackers)
+        self.func = func
+        self.decimals = decimals
+        self.integer_digits = integer_digits
+        self.templates, cell_width, cell_height = glyph_templates(font_size, font)
+
+        self.values = self.evaluate()
+        rows, cols = self.values.shape
+        # sign, integer digits, point, decimals
+        slots = 1 + integer_digits + (1 + decimals if decimals else 0)
+
+        # slot centres in a (rows, cols, slots) grid, top-left entry first
+        entry_width = slots * cell_width
+        x = (np.arange(cols)[:, None] * (entry_width + h_buff) + (np.arange(slots) + 0.5) * cell_width)
+        y = -np.arange(rows) * (cell_height + v_buff)
+        self.anchors = np.zeros((rows, cols, slots, 3))
+        self.anchors[..., 0] = x[None]
+        self.anchors[..., 1] = y[:, None, None]
+        self.anchors = self.anchors.reshape(-1, 3)
+
+        style = self.templates[0][1]
+        self.slots = VGroup(*[VMobject().match_style(style) for _ in self.anchors])
+        self.slots.set_color(color)
+
+        # brackets around the grid
+        left, right = -0.5 * h_buff, cols * (entry_width + h_buff) - 0.5 * h_buff
+        top, bottom = 0.5 * (cell_height + v_buff), y[-1] - 0.5 * (cell_height + v_buff)
+        tick = 0.6 * h_buff
+        self.left_bracket = VMobject(color=color).set_points_as_corners([
+            [left + tick, top, 0], [left, top, 0], [left, bottom, 0], [left + tick, bottom, 0]])
+        self.right_bracket = VMobject(color=color).set_points_as_corners([
+            [right - tick, top, 0], [right, top, 0], [right, bottom, 0], [right - tick, bottom, 0]])
+        self.add(self.slots, self.left_bracket, self.right_bracket)
+
+        # the left bracket tracks where the group has been moved or scaled to
+        self._frame_corner = self.left_bracket.get_corner(UL)
+        self._frame_height = self.left_bracket.height
+        self.codes = np.full(len(self.anchors), BLANK - 1)
+        self.refresh()
+        self.center()
+        self.add_updater(lambda m: m.refresh())
+
+    def evaluate(self):
+        return np.atleast_2d(np.asarray(self.func(*[t.get_value() for t in self.trackers]), dtype=float))
+
+    def format_codes(self, values):
+        """Template index (or BLANK) of every slot, for all entries at once."""
+        scale = 10 ** self.decimals
+        scaled = np.rint(np.abs(values.ravel()) * scale).astype(np.int64)
+        integer = np.minimum(scaled // scale, 10 ** self.integer_digits - 1)
+
+        columns = [np.where((values.ravel() < 0) & (scaled > 0), GLYPHS.index("-"), BLANK)]
+        for power in range(self.integer_digits - 1, -1, -1):
+            digit = integer // 10 ** power % 10
+            # leading zeros are blank, but the units digit is always shown
+            columns.append(np.where((integer < 10 ** power) & (power > 0), BLANK, digit))
+        if self.decimals:
+            columns.append(np.full(scaled.shape, GLYPHS.index(".")))
+            fraction = scaled % scale
+            for power in range(self.decimals - 1, -1, -1):
+                columns.append(fraction // 10 ** power % 10)
+        return np.stack(columns, axis=1).ravel()
+
+    def refresh(self):
+        self.values = self.evaluate()
+        codes = self.format_codes(self.values)
+        changed = np.flatnonzero(codes != self.codes)
+        if changed.size == 0:
+            return self
+
+        # map the layout into wherever the group currently is
+        scale = self.left_bracket.height / self._frame_height
+        origin = self.left_bracket.get_corner(UL) - scale * self._frame_corner
+        for index in changed:
+            slot = self.slots[index]
+            if codes[index] == BLANK:
+                slot.clear_points()
+            else:
+                slot.points = scale * self.templates[codes[index]][0] + (origin + scale * self.anchors[index])
+        self.codes = codes
+        return self
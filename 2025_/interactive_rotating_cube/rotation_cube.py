@@ -1,6 +1,14 @@
+import contextlib
 import numpy as np
-import time
-import os
+import sys
+
+from ascii_geometry import cube_geometry, shade
+from ascii_parallel import ParallelRasterizer
+from ascii_raster import resolve_depth
+from ascii_recorder import AsciicastRecorder
+from ascii_terminal import TerminalPresenter
+from frame_governor import FrameGovernor
+from rotations import euler_to_matrix
 
 # Initialize rotation angles
 A, B, C = 0.0, 0.0, 0.0
@@ -15,34 +23,24 @@ increment_speed = 0.6
 cube_width = 20.0
 horizontal_offset = -2 * cube_width
 
+# Direction towards the light for --shade: upper left, on the camera side (screen y points down)
+light = (-0.5, -0.7, -1.0)
+
 # Buffers
 z_buffer = np.zeros((width * height), dtype=float)
 buffer = np.full((width * height), bg_ascii, dtype=str)
 
+def set_screen_size(columns, rows):
+    """Resize the screen and buffers, scaling the projection so the cube keeps its relative size."""
+    global width, height, K1, z_buffer, buffer
+    K1 = K1 * rows / height
+    width, height = columns, rows
+    z_buffer = np.zeros((width * height), dtype=float)
+    buffer = np.full((width * height), bg_ascii, dtype=str)
+
 def get_rotation_matrix():
-    # Rotation around X-axis
-    Rx = np.array([
-        [1, 0, 0],
-        [0, np.cos(A), -np.sin(A)],
-        [0, np.sin(A), np.cos(A)]
-    ])
-    
-    # Rotation around Y-axis
-    Ry = np.array([
-        [np.cos(B), 0, np.sin(B)],
-        [0, 1, 0],
-        [-np.sin(B), 0, np.cos(B)]
-    ])
-    
-    # Rotation around Z-axis
-    Rz = np.array([
-        [np.cos(C), -np.sin(C), 0],
-        [np.sin(C), np.cos(C), 0],
-        [0, 0, 1]
-    ])
-    
-    # Combined rotation matrix
-    return Rz @ Ry @ Rx
+    # Rotation around X, then Y, then Z: Rz @ Ry @ Rx
+    return euler_to_matrix((A, B, C), "xyz")
 
 def calculate_plane(cube_x, cube_y, cube_z, ch):
     global z_buffer, buffer
@@ -66,41 +64,114 @@ def calculate_plane(cube_x, cube_y, cube_z, ch):
             z_buffer[idx] = ooz
             buffer[idx] = ch
 
-def main():
-    global A, B, C
+def get_geometry():
+    """Cached surface samples, normals and face characters for the current cube_width and increment_speed."""
+    return cube_geometry(cube_width, increment_speed)
+
+def project_points(rotated, screen):
+    """
+    Flat screen cell and 1/z of rotated samples, as in calculate_plane.
+    `screen` is (width, height, horizontal_offset, K1).
+    """
+    screen_width, screen_height, offset, k1 = screen
+    x, y, z = rotated[:, 0], rotated[:, 1], rotated[:, 2] + 100.0  # Adding distance from camera
     
-    # Clear screen
-    os.system('cls' if os.name == 'nt' else 'clear')
+    with np.errstate(divide='ignore'):
+        ooz = np.where(z != 0, 1.0 / z, 0.0)
     
-    while True:
-        # Reset buffers
-        buffer.fill(bg_ascii)
-        z_buffer.fill(0)
-        
-        # Calculate cube faces
-        for cube_x in np.arange(-cube_width, cube_width, increment_speed):
-            for cube_y in np.arange(-cube_width, cube_width, increment_speed):
-                calculate_plane(cube_x, cube_y, -cube_width, '@')  # Front face
-                calculate_plane(cube_width, cube_y, cube_x, '$')   # Right face
-                calculate_plane(-cube_width, cube_y, -cube_x, '~') # Left face
-                calculate_plane(-cube_x, cube_y, cube_width, '#')  # Back face
-                calculate_plane(cube_x, -cube_width, -cube_y, ';') # Bottom face
-                calculate_plane(cube_x, cube_width, cube_y, '+')   # Top face
-        
-        # Move cursor to home position
-        print("\033[H", end="")
-        
-        # Print the frame
-        for k in range(width * height):
-            print(buffer[k], end=('\n' if (k + 1) % width == 0 else ''))
+    # Calculate projected x and y (astype truncates toward zero like int())
+    xp = (screen_width // 2 + offset + k1 * ooz * x * 2).astype(int)
+    yp = (screen_height // 2 + k1 * ooz * y).astype(int)
+    return xp + yp * screen_width, ooz
+
+def screen_params():
+    return (width, height, horizontal_offset, K1)
+
+def render_frame(shaded=False, rasterizer=None):
+    """
+    Vectorized calculate_plane over all surface samples: one rotation, one
+    z-buffer pass (split over a ParallelRasterizer's workers if given). With
+    `shaded`, characters come from the rotated normals instead of the faces.
+    """
+    geometry = get_geometry()
+    R = get_rotation_matrix()
+    
+    if rasterizer is None:
+        idx, ooz = project_points(geometry.points @ R.T, screen_params())
+        # Per cell keep the nearest sample (largest ooz), earliest sample on ties
+        cells, winners = resolve_depth(idx, ooz, width * height)
+        depth = ooz[winners]
+    else:
+        rasterizer.set_points(geometry.points)
+        cells, winners, depth = rasterizer.render(R, screen_params())
+    
+    buffer.fill(bg_ascii)
+    z_buffer.fill(0)
+    if shaded:
+        buffer[cells] = shade(geometry.normals[winners] @ R.T, light).view('S1').astype(str)
+    else:
+        buffer[cells] = geometry.chars[winners]
+    z_buffer[cells] = depth
+
+# Rotation speeds in radians per second (0.05 / 0.05 / 0.01 per frame at 60 FPS)
+speed_A, speed_B, speed_C = 3.0, 3.0, 0.6
+
+def main(diff=False, target_fps=60.0, adapt=True, record=None, workers=1, processes=True, shaded=False):
+    global A, B, C, increment_speed
+    
+    governor = FrameGovernor(target_fps, sample_step=increment_speed, adapt=adapt)
+    
+    # Everything opened here is closed on the way out, however the loop ends
+    with contextlib.ExitStack() as stack:
+        # Optionally stream everything shown to an asciicast file as well
+        recorder = None
+        if record:
+            recorder = stack.enter_context(
+                AsciicastRecorder(record, width, height + 1, tee=sys.stdout.buffer, title="rotation_cube"))
         
-        # Update rotation angles
-        A += 0.05
-        B += 0.05
-        C += 0.01
+        # With several workers the samples are rasterized tile-parallel in shared memory
+        rasterizer = None
+        if workers > 1:
+            rasterizer = stack.enter_context(ParallelRasterizer(project_points, width, height, workers, processes))
         
-        # Delay for ~60 FPS
-        time.sleep(0.016)
+        # One write per frame; in diff mode only changed cells are sent
+        presenter = stack.enter_context(TerminalPresenter(width, height, diff=diff, stream=recorder))
+        try:
+            while True:
+                # Update rotation angles by elapsed time, in fixed steps
+                for _ in range(governor.advance()):
+                    A += speed_A * governor.timestep
+                    B += speed_B * governor.timestep
+                    C += speed_C * governor.timestep
+                
+                # Rasterize all cube faces at the governed sampling density
+                governor.begin_work()
+                increment_speed = governor.sample_step
+                render_frame(shaded, rasterizer)
+                
+                # Print the frame with the FPS / frame-time HUD
+                presenter.present(buffer, governor.hud())
+                
+                # Wait for the next frame deadline
+                governor.end_frame()
+        except KeyboardInterrupt:
+            pass
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Spinning ASCII cube.")
+    parser.add_argument("--diff", action="store_true", help="only redraw changed characters")
+    parser.add_argument("--fps", type=float, default=60.0, help="target frame rate")
+    parser.add_argument("--fixed-detail", action="store_true",
+                        help="keep increment_speed fixed instead of tuning it to the target FPS")
+    parser.add_argument("--record", metavar="FILE", help="also record to an asciicast file (.cast or .cast.gz)")
+    parser.add_argument("--size", nargs=2, type=int, metavar=("COLUMNS", "ROWS"), help="screen size (default 144 60)")
+    parser.add_argument("--workers", type=int, default=1, help="rasterize in parallel on this many workers")
+    parser.add_argument("--threads", action="store_true", help="use a thread pool instead of processes")
+    parser.add_argument("--shade", action="store_true", help="shade faces by their normal instead of one symbol per face")
+    args = parser.parse_args()
+    if args.size:
+        set_screen_size(*args.size)
+    main(diff=args.diff, target_fps=args.fps, adapt=not args.fixed_detail, record=args.record,
+         workers=args.workers, processes=not args.threads, shaded=args.shade)
@@ -1,11 +1,20 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+# Shared helpers (text atlas, ...) live one folder up in 2025_/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from text_atlas import cached_text
+from live_matrix import LiveMatrix
+from rotations import euler_to_matrix
+from track_rotation import TrackRotation
 
 class RotationMatrixIntro(Scene):
     """基础旋转矩阵介绍 - 2D平面上的旋转"""
     def construct(self):
         # 标题
-        title = Text("旋转矩阵：让物体转起来的数学魔法", font_size=40)
+        title = cached_text("旋转矩阵：让物体转起来的数学魔法", font_size=40)
         title.to_edge(UP)
         self.play(Write(title))
         self.wait()
@@ -18,12 +27,12 @@ class RotationMatrixIntro(Scene):
         ).scale(0.8)
         
         # 手动创建轴标签
-        x_label = Text("x", font_size=24).next_to(axes.x_axis.get_end(), RIGHT)
-        y_label = Text("y", font_size=24).next_to(axes.y_axis.get_end(), UP)
+        x_label = cached_text("x", font_size=24).next_to(axes.x_axis.get_end(), RIGHT)
+        y_label = cached_text("y", font_size=24).next_to(axes.y_axis.get_end(), UP)
         
         # 创建一个点
         point = Dot(color=RED).move_to(axes.c2p(2, 0))
-        point_label = Text("P(2,0)", font_size=24).next_to(point, RIGHT, buff=0.1)
+        point_label = cached_text("P(2,0)", font_size=24).next_to(point, RIGHT, buff=0.1)
         
         # 在坐标系中显示点
         self.play(Create(axes), Create(x_label), Create(y_label))
@@ -31,21 +40,21 @@ class RotationMatrixIntro(Scene):
         self.wait()
         
         # 解释什么是旋转
-        explanation = Text("旋转是什么？就是点围绕原点转动", font_size=28)
+        explanation = cached_text("旋转是什么？就是点围绕原点转动", font_size=28)
         explanation.to_edge(DOWN)
         self.play(Write(explanation))
         self.wait()
         
         # 演示旋转
         rotation_arc = Arc(start_angle=0, angle=PI/2, radius=2, color=YELLOW)
-        angle_label = Text("90°").move_to(axes.c2p(1, 1)) 
+        angle_label = cached_text("90°").move_to(axes.c2p(1, 1)) 
         
         self.play(Create(rotation_arc), Write(angle_label))
         self.wait()
         
         # 点旋转
         rotated_point = Dot(color=GREEN).move_to(axes.c2p(0, 2))
-        rotated_label = Text("P'(0,2)", font_size=24).next_to(rotated_point, UP, buff=0.1)
+        rotated_label = cached_text("P'(0,2)", font_size=24).next_to(rotated_point, UP, buff=0.1)
         
         self.play(
             Transform(point.copy(), rotated_point),
@@ -58,12 +67,12 @@ class RotationMatrixIntro(Scene):
         self.play(FadeOut(explanation))
         
         # 引入矩阵的概念
-        matrix_intro = Text("如何用矩阵来表示旋转？", font_size=28).to_edge(DOWN)
+        matrix_intro = cached_text("如何用矩阵来表示旋转？", font_size=28).to_edge(DOWN)
         self.play(Write(matrix_intro))
         self.wait()
         
         # 展示旋转矩阵
-        rotation_matrix = Text(
+        rotation_matrix = cached_text(
             "旋转矩阵(θ = 90°):\n" +
             "[[cos(θ), -sin(θ)],\n [sin(θ), cos(θ)]] = \n" +
             "[[0, -1],\n [1, 0]]", 
@@ -74,7 +83,7 @@ class RotationMatrixIntro(Scene):
         self.wait()
         
         # 展示矩阵乘法
-        matrix_operation = Text(
+        matrix_operation = cached_text(
             "[[0, -1],   [[2],    [[0],\n" +
             " [1,  0]] ×  [0]]  =  [2]]", 
             font_size=24
@@ -94,11 +103,11 @@ class RotationMatrixIntro(Scene):
         )
         
         # 介绍不同角度的旋转矩阵
-        angle_intro = Text("不同角度的旋转矩阵", font_size=32).next_to(title, DOWN)
+        angle_intro = cached_text("不同角度的旋转矩阵", font_size=32).next_to(title, DOWN)
         self.play(Write(angle_intro))
         
         # 展示通用旋转矩阵
-        general_matrix = Text(
+        general_matrix = cached_text(
             "旋转θ角度的矩阵:\n" +
             "[[cos(θ), -sin(θ)],\n [sin(θ), cos(θ)]]", 
             font_size=28
@@ -108,11 +117,11 @@ class RotationMatrixIntro(Scene):
         
         # 展示几个特殊角度的旋转矩阵
         special_angles = VGroup(
-            Text("θ = 0°: [[1, 0], [0, 1]] (不旋转)", font_size=24),
-            Text("θ = 90°: [[0, -1], [1, 0]]", font_size=24),
-            Text("θ = 180°: [[-1, 0], [0, -1]]", font_size=24),
-            Text("θ = 270°: [[0, 1], [-1, 0]]", font_size=24),
-            Text("θ = 360°: [[1, 0], [0, 1]] (转一圈回到原位)", font_size=24)
+            cached_text("θ = 0°: [[1, 0], [0, 1]] (不旋转)", font_size=24),
+            cached_text("θ = 90°: [[0, -1], [1, 0]]", font_size=24),
+            cached_text("θ = 180°: [[-1, 0], [0, -1]]", font_size=24),
+            cached_text("θ = 270°: [[0, 1], [-1, 0]]", font_size=24),
+            cached_text("θ = 360°: [[1, 0], [0, 1]] (转一圈回到原位)", font_size=24)
         ).arrange(DOWN, buff=0.3).next_to(general_matrix, DOWN, buff=0.5)
         
         for angle in special_angles:
@@ -128,12 +137,12 @@ class RotationMatrixIntro(Scene):
         )
         
         # 过渡到3D旋转
-        transition_text = Text("从2D到3D：当我们有了第三个维度", font_size=32).next_to(title, DOWN)
+        transition_text = cached_text("从2D到3D：当我们有了第三个维度", font_size=32).next_to(title, DOWN)
         self.play(Write(transition_text))
         self.wait()
         
         # 解释在3D空间中，旋转变得更复杂
-        d3_explanation = Text(
+        d3_explanation = cached_text(
             "在3D空间中，我们可以围绕三个不同的轴旋转：\n" +
             "X轴、Y轴和Z轴", 
             font_size=28
@@ -149,7 +158,7 @@ class RotationMatrixIntro(Scene):
         )
         
         # 进入3D演示的提示
-        final_text = Text("接下来，让我们进入3D空间，看看更神奇的旋转矩阵！", font_size=36)
+        final_text = cached_text("接下来，让我们进入3D空间，看看更神奇的旋转矩阵！", font_size=36)
         self.play(Write(final_text))
         self.wait(2)
 
@@ -161,7 +170,7 @@ class RotationMatrix3D(ThreeDScene):
         self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
         
         # 创建标题
-        title = Text("3D空间中的旋转矩阵", font_size=40)
+        title = cached_text("3D空间中的旋转矩阵", font_size=40)
         title.to_corner(UL)
         self.add_fixed_in_frame_mobjects(title)
         self.play(Write(title))
@@ -171,9 +180,9 @@ class RotationMatrix3D(ThreeDScene):
         self.add(axes)
         
         # 添加轴标签
-        x_label = Text("X轴", font_size=24).next_to(axes.get_x_axis(), direction=RIGHT)
-        y_label = Text("Y轴", font_size=24).next_to(axes.get_y_axis(), direction=UP)
-        z_label = Text("Z轴", font_size=24).next_to(axes.get_z_axis(), direction=OUT+UP)
+        x_label = cached_text("X轴", font_size=24).next_to(axes.get_x_axis(), direction=RIGHT)
+        y_label = cached_text("Y轴", font_size=24).next_to(axes.get_y_axis(), direction=UP)
+        z_label = cached_text("Z轴", font_size=24).next_to(axes.get_z_axis(), direction=OUT+UP)
         
         self.add_fixed_orientation_mobjects(x_label, y_label, z_label)
         
@@ -186,7 +195,7 @@ class RotationMatrix3D(ThreeDScene):
         self.wait()
         
         # 解释三个旋转轴
-        explanation = Text("在3D空间中，我们有三个旋转轴", font_size=28)
+        explanation = cached_text("在3D空间中，我们有三个旋转轴", font_size=28)
         explanation.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(explanation)
         self.play(Write(explanation))
@@ -194,12 +203,12 @@ class RotationMatrix3D(ThreeDScene):
         
         # 展示绕X轴旋转
         self.play(FadeOut(explanation))
-        x_rot_text = Text("绕X轴旋转 (Roll)", font_size=28, color=RED)
+        x_rot_text = cached_text("绕X轴旋转 (Roll)", font_size=28, color=RED)
         x_rot_text.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(x_rot_text)
         self.play(Write(x_rot_text))
         
-        rx_matrix = Text(
+        rx_matrix = cached_text(
             "Rx(α) = [[1, 0, 0], [0, cos(α), -sin(α)], [0, sin(α), cos(α)]]", 
             font_size=24
         )
@@ -213,12 +222,12 @@ class RotationMatrix3D(ThreeDScene):
         
         # 展示绕Y轴旋转
         self.play(FadeOut(x_rot_text), FadeOut(rx_matrix))
-        y_rot_text = Text("绕Y轴旋转 (Pitch)", font_size=28, color=GREEN)
+        y_rot_text = cached_text("绕Y轴旋转 (Pitch)", font_size=28, color=GREEN)
         y_rot_text.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(y_rot_text)
         self.play(Write(y_rot_text))
         
-        ry_matrix = Text(
+        ry_matrix = cached_text(
             "Ry(β) = [[cos(β), 0, sin(β)], [0, 1, 0], [-sin(β), 0, cos(β)]]", 
             font_size=24
         )
@@ -232,12 +241,12 @@ class RotationMatrix3D(ThreeDScene):
         
         # 展示绕Z轴旋转
         self.play(FadeOut(y_rot_text), FadeOut(ry_matrix))
-        z_rot_text = Text("绕Z轴旋转 (Yaw)", font_size=28, color=BLUE)
+        z_rot_text = cached_text("绕Z轴旋转 (Yaw)", font_size=28, color=BLUE)
         z_rot_text.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(z_rot_text)
         self.play(Write(z_rot_text))
         
-        rz_matrix = Text(
+        rz_matrix = cached_text(
             "Rz(γ) = [[cos(γ), -sin(γ), 0], [sin(γ), cos(γ), 0], [0, 0, 1]]", 
             font_size=24
         )
@@ -251,33 +260,41 @@ class RotationMatrix3D(ThreeDScene):
         
         # 展示组合旋转
         self.play(FadeOut(z_rot_text), FadeOut(rz_matrix))
-        combined_text = Text("组合旋转：将三个旋转矩阵相乘", font_size=28)
+        combined_text = cached_text("组合旋转：将三个旋转矩阵相乘", font_size=28)
         combined_text.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(combined_text)
         self.play(Write(combined_text))
         
-        combined_matrix = Text("R = Rz · Ry · Rx", font_size=28)
+        combined_matrix = cached_text("R = Rz · Ry · Rx", font_size=28)
         combined_matrix.next_to(title, DOWN)
         self.add_fixed_in_frame_mobjects(combined_matrix)
         self.play(Write(combined_matrix))
         
-        # 演示组合旋转
+        # 实时数值矩阵：与立方体使用同一个角度 α = β = γ
+        angle = ValueTracker(0)
+        live_matrix = LiveMatrix([angle], lambda t: euler_to_matrix((t, t, t), "xyz"), font_size=24)
+        live_matrix.next_to(combined_matrix, DOWN)
+        self.add_fixed_in_frame_mobjects(live_matrix)
+        self.play(Write(live_matrix))
+        
+        # 演示组合旋转：每帧对原始顶点只乘一次 R = Rz·Ry·Rx（α = β = γ 从 0 到 π/4）
+        angles = np.linspace(0, PI/4, 61)[:, None].repeat(3, axis=1)
         self.play(
-            Rotating(cube, axis=RIGHT, radians=PI/4, run_time=2),
-            Rotating(cube, axis=UP, radians=PI/4, run_time=2),
-            Rotating(cube, axis=OUT, radians=PI/4, run_time=2),
+            TrackRotation(cube, euler_to_matrix(angles, "xyz")),
+            angle.animate.set_value(PI/4),
+            run_time=2
         )
         self.wait()
         
         # 结束文本
-        self.play(FadeOut(combined_text), FadeOut(combined_matrix))
+        self.play(FadeOut(combined_text), FadeOut(combined_matrix), FadeOut(live_matrix))
         
-        final_text = Text("旋转顺序很重要：Rz·Ry·Rx ≠ Rx·Ry·Rz", font_size=28)
+        final_text = cached_text("旋转顺序很重要：Rz·Ry·Rx ≠ Rx·Ry·Rz", font_size=28)
         final_text.to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(final_text)
         self.play(Write(final_text))
         
-        application_text = Text("这些矩阵在3D游戏、动画和机器人技术中至关重要", font_size=24)
+        application_text = cached_text("这些矩阵在3D游戏、动画和机器人技术中至关重要", font_size=24)
         application_text.next_to(final_text, UP)
         self.add_fixed_in_frame_mobjects(application_text)
         self.play(Write(application_text))
@@ -293,16 +310,16 @@ class RotationMatrix3D(ThreeDScene):
 class RotationMatrixSummary(Scene):
     """旋转矩阵总结"""
     def construct(self):
-        title = Text("旋转矩阵总结", font_size=40)
+        title = cached_text("旋转矩阵总结", font_size=40)
         title.to_edge(UP)
         self.play(Write(title))
         
         summary_points = VGroup(
-            Text("1. 旋转矩阵是特殊的正交矩阵，用于描述旋转变换", font_size=28),
-            Text("2. 2D旋转只需要一个角度参数θ", font_size=28),
-            Text("3. 3D旋转需要围绕三个轴(X, Y, Z)分别旋转", font_size=28),
-            Text("4. 旋转的顺序很重要，不同顺序会得到不同结果", font_size=28),
-            Text("5. 旋转矩阵的应用广泛：游戏开发、机器人技术、\n   计算机图形学等", font_size=28),
+            cached_text("1. 旋转矩阵是特殊的正交矩阵，用于描述旋转变换", font_size=28),
+            cached_text("2. 2D旋转只需要一个角度参数θ", font_size=28),
+            cached_text("3. 3D旋转需要围绕三个轴(X, Y, Z)分别旋转", font_size=28),
+            cached_text("4. 旋转的顺序很重要，不同顺序会得到不同结果", font_size=28),
+            cached_text("5. 旋转矩阵的应用广泛：游戏开发、机器人技术、\n   计算机图形学等", font_size=28),
         ).arrange(DOWN, buff=0.5, aligned_edge=LEFT).next_to(title, DOWN, buff=0.5)
         
         for point in summary_points:
@@ -312,7 +329,7 @@ class RotationMatrixSummary(Scene):
         self.wait()
         
         # 扩展学习建议
-        next_steps = Text(
+        next_steps = cached_text(
             "想深入学习？探索：\n" +
             "- 四元数(Quaternions)\n" +
             "- 欧拉角(Euler Angles)\n" +
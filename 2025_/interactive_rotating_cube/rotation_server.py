@@ -0,0 +1,338 @@
+"""
+Local backend for index.html: serves the page and streams rotation state
+computed in NumPy over a WebSocket, using only the standard library.
+
+    python rotation_server.py               # http://localhost:8765
+    python rotation_server.py --vendor      # download three.js / math.js once into vendor/
+
+The page loads its libraries from vendor/ and falls back to the CDN, so once
+the assets are vendored the demo works offline. Without the server (opened
+as a file, or the socket drops) the page computes the matrices itself.
+
+Protocol (JSON text messages):
+
+    -> {"type": "angles", "angles": [α, β, γ]}            degrees, R = Rz·Ry·Rx
+    -> {"type": "track", "from": [...], "to": [...], "frames": 60}
+    -> {"type": "options", "ascii": true, "shade": false}
+    <- {"type": "state", "seq": n, "matrix": ..., "rx": ..., "euler": {...}, "ascii": "..."}
+    <- {"type": "track", "matrices": [...], "euler": [...]}
+
+Slider events are coalesced: the reader only records the newest angles and
+wakes the writer, which computes and sends one state at a time and waits for
+the socket to drain before the next. A client dragging faster than the
+network or the renderer can follow therefore gets the latest orientation
+instead of a growing backlog. The page also keeps only one angles message in
+flight, releasing the next when a state with its `seq` comes back.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import struct
+import urllib.parse
+import urllib.request
+
+import numpy as np
+
+import rotation_cube
+from rotations import axis_matrix, euler_to_matrix, euler_to_quaternion, matrix_to_euler, \
+    matrix_to_quaternion, quaternion_to_matrix, slerp
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_FILE = os.path.join(THIS_DIR, "index.html")
+VENDOR_DIR = os.path.join(THIS_DIR, "vendor")
+VENDOR_ASSETS = {
+    "three.min.js": "https://cdn.jsdelivr.net/npm/three@0.137.0/build/three.min.js",
+    "math.min.js": "https://cdn.jsdelivr.net/npm/mathjs@11.2.0/lib/browser/math.min.js",
+}
+
+EULER_ORDERS = ("xyz", "xzy", "yxz", "yzx", "zxy", "zyx")
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_MESSAGE = 1 << 16
+MAX_TRACK_FRAMES = 600
+
+# WebSocket opcodes
+CONTINUATION, TEXT, BINARY, CLOSE, PING, PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+# ---------------------------------------------------------------- engine
+
+def rotation_state(angles, ascii=False, shade=False):
+    """Per-axis and combined matrices, quaternion and Euler decompositions for angles in degrees."""
+    alpha, beta, gamma = np.radians(np.asarray(angles, dtype=float))
+    R = euler_to_matrix((alpha, beta, gamma), "xyz")
+    state = {
+        "angles": [float(a) for a in angles],
+        "rx": axis_matrix("x", alpha).round(6).tolist(),
+        "ry": axis_matrix("y", beta).round(6).tolist(),
+        "rz": axis_matrix("z", gamma).round(6).tolist(),
+        "matrix": R.round(6).tolist(),
+        "quaternion": matrix_to_quaternion(R).round(6).tolist(),
+        "euler": {order: np.degrees(matrix_to_euler(R, order)).round(3).tolist() for order in EULER_ORDERS},
+    }
+    if ascii:
+        state["ascii"] = ascii_frame(alpha, beta, gamma, shade)
+    return state
+
+
+def ascii_frame(alpha, beta, gamma, shade=False):
+    """The rotation_cube.py frame for these angles, as text."""
+    rotation_cube.A, rotation_cube.B, rotation_cube.C = alpha, beta, gamma
+    rotation_cube.render_frame(shade)
+    rows = rotation_cube.buffer.reshape(rotation_cube.height, rotation_cube.width)
+    return "\n".join("".join(row).rstrip() for row in rows)
+
+
+def rotation_track(start, end, frames=60):
+    """Slerped matrices (and their xyz Euler angles) from one orientation to another, in degrees."""
+    frames = int(np.clip(frames, 2, MAX_TRACK_FRAMES))
+    q0, q1 = euler_to_quaternion(np.radians([start, end]), "xyz")
+    R = quaternion_to_matrix(slerp(q0, q1, np.linspace(0, 1, frames)))
+    return {
+        "matrices": R.round(6).tolist(),
+        "euler": np.degrees(matrix_to_euler(R, "xyz")).round(3).tolist(),
+    }
+
+
+# ---------------------------------------------------------------- websocket
+
+def accept_key(key):
+    return base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+
+
+def encode_frame(opcode, payload=b""):
+    """Unmasked server frame."""
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 1 << 16:
+        header += bytes([126]) + struct.pack("!H", length)
+    else:
+        header += bytes([127]) + struct.pack("!Q", length)
+    return header + payload
+
+
+async def read_frame(reader):
+    """(fin, opcode, payload) of the next client frame."""
+    b0, b1 = await reader.readexactly(2)
+    length = b1 & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_MESSAGE:
+        raise ConnectionError(f"frame of {length} bytes exceeds {MAX_MESSAGE}")
+    mask = await reader.readexactly(4) if b1 & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        data = np.frombuffer(payload, dtype=np.uint8) ^ np.resize(np.frombuffer(mask, dtype=np.uint8), length)
+        payload = data.tobytes()
+    return bool(b0 & 0x80), b0 & 0x0F, payload
+
+
+def _angles(values):
+    angles = [float(a) for a in values]
+    if len(angles) != 3 or not np.all(np.isfinite(angles)):
+        raise ValueError("expected three finite angles")
+    return angles
+
+
+class RotationSession:
+    """One WebSocket client: a reader that coalesces requests and a writer that answers them."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending_angles = None
+        self.pending_track = None
+        self.seq = 0
+        self.last_angles = [0.0, 0.0, 0.0]
+        self.options = {"ascii": False, "shade": False}
+        self.received = 0
+        self.sent = 0
+        self.wake = asyncio.Event()
+        self.closed = False
+        # drain() blocks above this much unsent data, which is what throttles the writer
+        writer.transport.set_write_buffer_limits(high=1 << 16)
+
+    async def run(self):
+        writer_task = asyncio.create_task(self.write_loop())
+        try:
+            await self.read_loop()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.closed = True
+            self.wake.set()
+            await writer_task
+
+    async def read_loop(self):
+        fragments = []
+        while not self.closed:
+            fin, opcode, payload = await read_frame(self.reader)
+            if opcode == CLOSE:
+                await self.send(CLOSE, payload[:2])
+                return
+            if opcode == PING:
+                await self.send(PONG, payload)
+                continue
+            if opcode in (TEXT, CONTINUATION):
+                fragments.append(payload)
+                if sum(map(len, fragments)) > MAX_MESSAGE:
+                    raise ConnectionError("message too large")
+                if fin:
+                    self.handle(b"".join(fragments))
+                    fragments = []
+
+    def handle(self, data):
+        try:
+            message = json.loads(data)
+            kind = message.get("type")
+            if kind == "angles":
+                # only the newest angles matter; anything not yet sent is replaced
+                self.pending_angles = _angles(message["angles"])
+                self.seq = int(message.get("seq", self.seq + 1))
+                self.received += 1
+            elif kind == "track":
+                self.pending_track = (_angles(message["from"]), _angles(message["to"]),
+                                      int(message.get("frames", 60)))
+            elif kind == "options":
+                self.options.update({k: bool(v) for k, v in message.items() if k in self.options})
+                if self.pending_angles is None and self.sent:
+                    self.pending_angles = self.last_angles
+            else:
+                return
+        except (ValueError, KeyError, TypeError):
+            return
+        self.wake.set()
+
+    async def write_loop(self):
+        while True:
+            await self.wake.wait()
+            self.wake.clear()
+            if self.closed:
+                return
+            try:
+                if self.pending_track is not None:
+                    track, self.pending_track = self.pending_track, None
+                    await self.send_json(dict(type="track", **rotation_track(*track)))
+                if self.pending_angles is not None:
+                    angles, self.pending_angles = self.pending_angles, None
+                    state = rotation_state(angles, self.options["ascii"], self.options["shade"])
+                    self.sent += 1
+                    state.update(type="state", seq=self.seq, coalesced=self.received - self.sent)
+                    self.last_angles = angles
+                    await self.send_json(state)
+            except ConnectionError:
+                return
+
+    async def send_json(self, message):
+        await self.send(TEXT, json.dumps(message, separators=(",", ":")).encode())
+
+    async def send(self, opcode, payload=b""):
+        self.writer.write(encode_frame(opcode, payload))
+        await self.writer.drain()
+
+
+# ---------------------------------------------------------------- http
+
+async def read_request(reader):
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    method, target, _ = (request_line.split(" ", 2) + ["", ""])[:3]
+    return method, urllib.parse.urlsplit(target).path, headers
+
+
+def http_response(status, body=b"", content_type="text/plain; charset=utf-8"):
+    head = (f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            "Cache-Control: no-cache\r\nConnection: close\r\n\r\n")
+    return head.encode() + body
+
+
+def static_file(path):
+    """(bytes, content type) for the page and vendored assets, or None."""
+    if path in ("/", "/index.html"):
+        filename = INDEX_FILE
+    elif path.startswith("/vendor/"):
+        filename = os.path.join(VENDOR_DIR, os.path.basename(path))
+    else:
+        return None
+    if not os.path.isfile(filename):
+        return None
+    with open(filename, "rb") as fp:
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        return fp.read(), content_type
+
+
+async def handle_connection(reader, writer):
+    try:
+        method, path, headers = await read_request(reader)
+        if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+            writer.write((
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(headers.get('sec-websocket-key', ''))}\r\n\r\n"
+            ).encode())
+            await writer.drain()
+            await RotationSession(reader, writer).run()
+            return
+        found = static_file(path) if method in ("GET", "HEAD") else None
+        if found is None:
+            writer.write(http_response("404 Not Found", b"not found\n"))
+        else:
+            body, content_type = found
+            response = http_response("200 OK", body, content_type)
+            writer.write(response if method == "GET" else response[:len(response) - len(body)])
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="localhost", port=8765):
+    server = await asyncio.start_server(handle_connection, host, port)
+    print(f"Serving http://{host}:{port}/  (WebSocket at /ws)")
+    async with server:
+        await server.serve_forever()
+
+
+def vendor_assets(force=False):
+    """Download the page's JavaScript libraries into vendor/ so the demo runs offline."""
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    for name, url in VENDOR_ASSETS.items():
+        target = os.path.join(VENDOR_DIR, name)
+        if os.path.exists(target) and not force:
+            print(f"{name}: present")
+            continue
+        with urllib.request.urlopen(url, timeout=30) as response:
+            data = response.read()
+        with open(target, "wb") as fp:
+            fp.write(data)
+        print(f"{name}: {len(data)} bytes from {url}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve index.html with a NumPy rotation backend.")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--vendor", action="store_true", help="download the JavaScript assets into vendor/ and exit")
+    args = parser.parse_args()
+    if args.vendor:
+        vendor_assets()
+    else:
+        try:
+            asyncio.run(serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
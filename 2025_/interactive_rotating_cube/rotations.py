@@ -0,0 +1,219 @@
+"""
+Batched 3D rotations: Euler angles, axis-angle, quaternions and matrices.
+
+Every function takes arrays with any number of leading batch dimensions and
+broadcasts them, so a whole animation track (one orientation per frame) is
+converted, composed or interpolated in one call:
+
+    angles = np.stack([A, B, C], axis=-1)           # (frames, 3)
+    R = euler_to_matrix(angles, "xyz")               # (frames, 3, 3)
+    q = slerp(q0, q1, np.linspace(0, 1, frames))     # (frames, 4)
+
+Conventions
+-----------
+- Matrices act on column vectors: v' = R @ v.
+- Euler angles are extrinsic: order "xyz" rotates about x by angles[..., 0],
+  then about the fixed y by angles[..., 1], then about z by angles[..., 2],
+  i.e. R = Rz @ Ry @ Rx as in rotation_cube.get_rotation_matrix.
+- Quaternions are (w, x, y, z) unit quaternions, as in Manim.
+"""
+
+import numpy as np
+
+AXES = {"x": 0, "y": 1, "z": 2}
+
+
+def _axis_index(order):
+    order = order.lower()
+    if len(order) != 3 or set(order) - set(AXES) or len(set(order)) != 3:
+        raise ValueError(f"Euler order must be a permutation of 'xyz', got {order!r}")
+    return [AXES[a] for a in order]
+
+
+def axis_matrix(axis, angle):
+    """(..., 3, 3) rotations by `angle` about the coordinate axis 'x', 'y' or 'z'."""
+    angle = np.asarray(angle, dtype=float)
+    c, s = np.cos(angle), np.sin(angle)
+    i = AXES[axis]
+    j, k = (i + 1) % 3, (i + 2) % 3
+    R = np.zeros(angle.shape + (3, 3))
+    R[..., i, i] = 1
+    R[..., j, j] = c
+    R[..., k, k] = c
+    R[..., j, k] = -s
+    R[..., k, j] = s
+    return R
+
+
+def compose(*matrices):
+    """Product of rotation matrices, first argument applied last (like `@`), broadcast over the batch."""
+    result = np.asarray(matrices[0], dtype=float)
+    for R in matrices[1:]:
+        # batched matmul beats the equivalent einsum several times over for 3x3 stacks
+        result = result @ R
+    return result
+
+
+def rotate(R, points):
+    """Apply (..., 3, 3) rotations to (..., N, 3) points."""
+    return points @ np.swapaxes(R, -1, -2)
+
+
+def euler_to_matrix(angles, order="xyz"):
+    """(..., 3) extrinsic Euler angles -> (..., 3, 3) matrices."""
+    _axis_index(order)
+    angles = np.asarray(angles, dtype=float)
+    first, second, third = (axis_matrix(axis, angles[..., n]) for n, axis in enumerate(order.lower()))
+    return compose(third, second, first)
+
+
+def matrix_to_euler(R, order="xyz"):
+    """
+    (..., 3, 3) matrices -> (..., 3) extrinsic Euler angles, the middle angle
+    in [-π/2, π/2]. At gimbal lock the last angle is set to 0.
+    """
+    R = np.asarray(R, dtype=float)
+    i, j, k = _axis_index(order)
+    # +1 for cyclic orders (xyz, yzx, zxy), -1 for the others
+    sign = 1.0 if (j - i) % 3 == 1 else -1.0
+
+    second = np.arcsin(np.clip(-sign * R[..., k, i], -1.0, 1.0))
+    first = np.arctan2(sign * R[..., k, j], R[..., k, k])
+    third = np.arctan2(sign * R[..., j, i], R[..., i, i])
+
+    locked = np.abs(np.cos(second)) < 1e-9
+    first = np.where(locked, np.arctan2(-sign * R[..., j, k], R[..., j, j]), first)
+    third = np.where(locked, 0.0, third)
+    return np.stack([first, second, third], axis=-1)
+
+
+def axis_angle_to_matrix(axis, angle):
+    """Rodrigues' formula: (..., 3) axes and (...) angles -> (..., 3, 3) matrices."""
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    angle = np.asarray(angle, dtype=float)[..., None, None]
+    x, y, z = axis[..., 0], axis[..., 1], axis[..., 2]
+    zero = np.zeros_like(x)
+    K = np.stack([
+        np.stack([zero, -z, y], axis=-1),
+        np.stack([z, zero, -x], axis=-1),
+        np.stack([-y, x, zero], axis=-1),
+    ], axis=-2)
+    return np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
+
+
+def quaternion_from_axis_angle(axis, angle):
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    half = np.asarray(angle, dtype=float)[..., None] / 2
+    vector = np.sin(half) * axis
+    return np.concatenate([np.broadcast_to(np.cos(half), vector.shape[:-1] + (1,)), vector], axis=-1)
+
+
+def quaternion_to_axis_angle(q):
+    """(..., 4) quaternions -> ((..., 3) unit axes, (...) angles in [0, π]); the axis is x for no rotation."""
+    q = normalize_quaternion(q)
+    # the sign of q is free; pick w >= 0 so the angle is at most π
+    q = np.where(q[..., :1] < 0, -q, q)
+    vector = q[..., 1:]
+    norm = np.linalg.norm(vector, axis=-1)
+    angle = 2 * np.arctan2(norm, q[..., 0])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        axis = np.where(norm[..., None] > 1e-12, vector / norm[..., None], [1.0, 0.0, 0.0])
+    return axis, angle
+
+
+def normalize_quaternion(q):
+    q = np.asarray(q, dtype=float)
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def quaternion_multiply(q1, q2):
+    """Hamilton product q1 * q2 (rotation q2 followed by q1), broadcast over the batch."""
+    w1, x1, y1, z1 = np.moveaxis(np.asarray(q1, dtype=float), -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(np.asarray(q2, dtype=float), -1, 0)
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    ], axis=-1)
+
+
+def quaternion_conjugate(q):
+    return np.asarray(q, dtype=float) * [1, -1, -1, -1]
+
+
+def quaternion_to_matrix(q):
+    w, x, y, z = np.moveaxis(normalize_quaternion(q), -1, 0)
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=-1),
+        np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=-1),
+        np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=-1),
+    ], axis=-2)
+
+
+def matrix_to_quaternion(R):
+    """
+    (..., 3, 3) rotation matrices -> (..., 4) quaternions with w >= 0.
+    Each entry uses the largest of w, x, y, z as pivot (Shepperd's method)
+    so the result is accurate for every rotation angle.
+    """
+    R = np.asarray(R, dtype=float)
+    trace = np.trace(R, axis1=-2, axis2=-1)
+    diagonal = np.diagonal(R, axis1=-2, axis2=-1)
+    # 4 * component**2 for w, x, y, z
+    squares = np.stack([1 + trace, 1 + 2 * diagonal[..., 0] - trace,
+                        1 + 2 * diagonal[..., 1] - trace, 1 + 2 * diagonal[..., 2] - trace], axis=-1)
+    pivot = squares.argmax(axis=-1)
+
+    # 4 * pivot * other components, from the off-diagonal sums and differences
+    d = np.stack([R[..., 2, 1] - R[..., 1, 2], R[..., 0, 2] - R[..., 2, 0], R[..., 1, 0] - R[..., 0, 1]], axis=-1)
+    s = np.stack([R[..., 0, 1] + R[..., 1, 0], R[..., 0, 2] + R[..., 2, 0], R[..., 1, 2] + R[..., 2, 1]], axis=-1)
+    rows = np.stack([
+        np.stack([squares[..., 0], d[..., 0], d[..., 1], d[..., 2]], axis=-1),
+        np.stack([d[..., 0], squares[..., 1], s[..., 0], s[..., 1]], axis=-1),
+        np.stack([d[..., 1], s[..., 0], squares[..., 2], s[..., 2]], axis=-1),
+        np.stack([d[..., 2], s[..., 1], s[..., 2], squares[..., 3]], axis=-1),
+    ], axis=-2)
+    q = np.take_along_axis(rows, pivot[..., None, None], axis=-2)[..., 0, :]
+    q = normalize_quaternion(q)
+    return np.where(q[..., :1] < 0, -q, q)
+
+
+def euler_to_quaternion(angles, order="xyz"):
+    _axis_index(order)
+    angles = np.asarray(angles, dtype=float)
+    q = None
+    for n, axis in enumerate(order.lower()):
+        unit = np.zeros(3)
+        unit[AXES[axis]] = 1
+        step = quaternion_from_axis_angle(unit, angles[..., n])
+        q = step if q is None else quaternion_multiply(step, q)
+    return q
+
+
+def quaternion_to_euler(q, order="xyz"):
+    return matrix_to_euler(quaternion_to_matrix(q), order)
+
+
+def slerp(q0, q1, t):
+    """
+    Spherical linear interpolation between unit quaternions along the
+    shorter arc. `t` broadcasts against the batch, so a scalar pair of
+    keyframes and a (frames,) array of t give a (frames, 4) track.
+    """
+    q0, q1 = normalize_quaternion(q0), normalize_quaternion(q1)
+    t = np.asarray(t, dtype=float)[..., None]
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    # q and -q are the same rotation: flip q1 to take the shorter way round
+    q1 = np.where(dot < 0, -q1, q1)
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    close = sin_theta < 1e-6
+    with np.errstate(invalid="ignore", divide="ignore"):
+        w0 = np.where(close, 1 - t, np.sin((1 - t) * theta) / sin_theta)
+        w1 = np.where(close, t, np.sin(t * theta) / sin_theta)
+    return normalize_quaternion(w0 * q0 + w1 * q1)
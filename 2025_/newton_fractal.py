@@ -0,0 +1,200 @@
+"""
+Newton fractals: basins of attraction of a complex polynomial.
+
+The image is split into row tiles of at most `tile_pixels` points, so memory
+stays bounded no matter how large the grid is (4K and beyond). Tiles are
+solved with `newton_solve` on a process pool and written straight into the
+output arrays, which can be `.npy` files memory-mapped on disk.
+
+    with NewtonFractal([1, 0, 0, -1]) as fractal:         # z^3 - 1
+        tiles = fractal.render(center=0, span=4, shape=(2160, 3840))
+        rgba = fractal.shade(tiles)
+
+`fractal.frames(...)` yields a zoom sequence that reuses the same pool.
+`NewtonFractal(..., dtype=np.complex64)` solves in single precision, with
+half the memory per tile; the tolerance is raised to what it can resolve.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from newton_solver import classify_roots, newton_solve
+
+# One colour per root, cycled for higher degrees (RGB, 0-255)
+ROOT_COLORS = np.array([
+    [231, 76, 60],
+    [46, 204, 113],
+    [52, 152, 219],
+    [241, 196, 15],
+    [155, 89, 182],
+    [26, 188, 156],
+    [230, 126, 34],
+], dtype=np.float32)
+
+
+class FractalTiles(NamedTuple):
+    basins: np.ndarray       # int8 index into roots, -1 where the start did not converge
+    iterations: np.ndarray   # uint16 Newton steps until convergence
+
+
+def complex_grid(center, span, shape, rows=None, dtype=np.complex128):
+    """
+    Points of the complex plane sampled by an image of `shape` (height, width).
+    `span` is the width of the view; pixels are square. `rows` selects a slice
+    of image rows, top row first (largest imaginary part).
+    """
+    height, width = shape
+    rows = rows or (0, height)
+    step = span / width
+    x = center.real + (np.arange(width) - (width - 1) / 2) * step
+    y = center.imag - (np.arange(rows[0], rows[1]) - (height - 1) / 2) * step
+    return (x[None, :] + 1j * y[:, None]).astype(dtype)
+
+
+def _solve_tile(coeffs, roots, center, span, shape, rows, max_iter, tol, dtype, out_paths):
+    """Worker: solve one row tile, write it to the memmaps if given, else return it."""
+    # evaluate the polynomial in the grid's precision, so complex64 stays complex64 throughout
+    coeffs = coeffs.astype(dtype)
+    dcoeffs = np.polyder(coeffs)
+    # a step cannot get much below the precision's epsilon, so the tolerance must not either
+    tol = max(tol, 16 * np.finfo(dtype).eps)
+    z = complex_grid(center, span, shape, rows, dtype)
+    result = newton_solve(
+        lambda z: np.polyval(coeffs, z),
+        lambda z: np.polyval(dcoeffs, z),
+        z, tol=tol, max_iter=max_iter,
+    )
+    basins = classify_roots(result.roots, roots, tol=max(1e3 * tol, 1e-6)).astype(np.int8)
+    basins[~result.converged] = -1
+    iterations = result.iterations.astype(np.uint16)
+
+    if out_paths is None:
+        return rows, basins, iterations
+    for path, tile in zip(out_paths, (basins, iterations)):
+        target = np.load(path, mmap_mode="r+")
+        target[rows[0]:rows[1]] = tile
+        target.flush()
+        del target
+    return rows, None, None
+
+
+class NewtonFractal:
+    """Basin renderer for the polynomial with coefficients `coeffs` (highest power first)."""
+
+    def __init__(self, coeffs, max_iter=40, tol=1e-8, tile_pixels=1 << 18,
+                 workers=None, dtype=np.complex128):
+        self.coeffs = np.asarray(coeffs, dtype=np.complex128)
+        self.roots = np.roots(self.coeffs)
+        self.max_iter = max_iter
+        self.tol = tol
+        self.tile_pixels = tile_pixels
+        self.dtype = dtype
+        self.workers = workers or os.cpu_count()
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def pool(self):
+        if self._pool is None and self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def tiles(self, shape):
+        """Row ranges covering an image of `shape`, each at most `tile_pixels` points."""
+        height, width = shape
+        rows_per_tile = max(1, self.tile_pixels // width)
+        return [(r, min(r + rows_per_tile, height)) for r in range(0, height, rows_per_tile)]
+
+    def render(self, center=0j, span=4.0, shape=(1080, 1920), out_dir=None):
+        """
+        Solve every pixel of the view. With `out_dir`, the results are
+        `basins.npy` / `iterations.npy` memory-mapped in that folder and the
+        workers write their tiles directly into them.
+        """
+        center = complex(center)
+        out_paths = None
+        if out_dir is not None:
+            os.makedirs(out_dir, exist_ok=True)
+            out_paths = (os.path.join(out_dir, "basins.npy"), os.path.join(out_dir, "iterations.npy"))
+            basins = np.lib.format.open_memmap(out_paths[0], mode="w+", dtype=np.int8, shape=shape)
+            iterations = np.lib.format.open_memmap(out_paths[1], mode="w+", dtype=np.uint16, shape=shape)
+        else:
+            basins = np.empty(shape, dtype=np.int8)
+            iterations = np.empty(shape, dtype=np.uint16)
+
+        args = (self.coeffs, self.roots, center, span, shape)
+        options = (self.max_iter, self.tol, self.dtype, out_paths)
+        if self.pool is None:
+            results = (_solve_tile(*args, rows, *options) for rows in self.tiles(shape))
+        else:
+            futures = [self.pool.submit(_solve_tile, *args, rows, *options) for rows in self.tiles(shape)]
+            results = (future.result() for future in futures)
+
+        for (r0, r1), basin_tile, iteration_tile in results:
+            if basin_tile is not None:
+                basins[r0:r1] = basin_tile
+                iterations[r0:r1] = iteration_tile
+
+        if out_paths is not None:
+            # reopen read-only so the workers' writes are what we hand back
+            del basins, iterations
+            basins, iterations = (np.load(path, mmap_mode="r") for path in out_paths)
+        return FractalTiles(basins, iterations)
+
+    def shade(self, tiles, colors=ROOT_COLORS):
+        """
+        RGBA image: hue from the basin, brightness falling off with the
+        iteration count. Points that never converged are black.
+        """
+        basins, iterations = tiles
+        palette = np.vstack([colors[np.arange(len(self.roots)) % len(colors)], [[0, 0, 0]]])
+        shade = 1.0 - np.minimum(iterations, self.max_iter).astype(np.float32) / self.max_iter
+        rgba = np.empty(basins.shape + (4,), dtype=np.uint8)
+        rgba[..., :3] = palette[basins] * (0.25 + 0.75 * shade)[..., None]
+        rgba[..., 3] = 255
+        return rgba
+
+    def frames(self, center, start_span, end_span, n_frames, shape=(1080, 1920)):
+        """Shaded frames of a geometric zoom from `start_span` to `end_span` around `center`."""
+        for span in np.geomspace(start_span, end_span, n_frames):
+            yield self.shade(self.render(center, span, shape))
+
+
+def to_image_mobject(rgba, height=None):
+    """Wrap a shaded frame in a Manim `ImageMobject` (Manim is only imported here)."""
+    from manim import ImageMobject, config
+
+    image = ImageMobject(rgba)
+    image.height = height or config.frame_height
+    return image
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Render a Newton fractal for z^3 - 1.")
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="newton_fractal", help="folder for the memory-mapped arrays")
+    args = parser.parse_args()
+
+    with NewtonFractal([1, 0, 0, -1], workers=args.workers) as fractal:
+        start = time.perf_counter()
+        tiles = fractal.render(shape=(args.height, args.width), out_dir=args.out)
+        print(f"{args.width}x{args.height} in {time.perf_counter() - start:.2f}s -> {args.out}/")
+        np.save(os.path.join(args.out, "image.npy"), fractal.shade(tiles))
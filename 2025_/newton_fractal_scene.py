@@ -0,0 +1,36 @@
+from manim import *
+import numpy as np
+
+from newton_fractal import NewtonFractal, to_image_mobject
+
+
+class NewtonFractalZoom(Scene):
+    """牛顿分形：z³ - 1 的三个根的吸引域，并放大观察边界"""
+    coeffs = [1, 0, 0, -1]
+    # 极点 0 的原像，位于吸引域边界上：放大到底仍能看到三种颜色
+    zoom_center = -2 ** (-1 / 3) + 0.0j
+    start_span = 4.0
+    end_span = 0.02
+
+    def construct(self):
+        shape = (config.pixel_height, config.pixel_width)
+        with NewtonFractal(self.coeffs, max_iter=60) as fractal:
+            title = Text("牛顿分形 z³ - 1 = 0", font_size=36).to_edge(UP)
+            title.set_stroke(BLACK, 6, background=True)
+
+            # Zoom geometrically: animate log(span) linearly
+            log_span = ValueTracker(np.log(self.start_span))
+            image = to_image_mobject(fractal.shade(fractal.render(self.zoom_center, self.start_span, shape)))
+
+            # Re-solve the visible window every frame; the process pool stays warm between frames
+            def update_image(mob):
+                tiles = fractal.render(self.zoom_center, np.exp(log_span.get_value()), shape)
+                mob.pixel_array = fractal.shade(tiles)
+
+            self.play(FadeIn(image), Write(title))
+            self.wait()
+
+            image.add_updater(update_image)
+            self.play(log_span.animate.set_value(np.log(self.end_span)), rate_func=linear, run_time=8)
+            image.remove_updater(update_image)
+            self.wait()
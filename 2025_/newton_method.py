@@ -2,6 +2,9 @@ from manim import *
 import numpy as np
 import os
 
+from symbolic_function import SymbolicFunction
+from text_atlas import cached_text
+
 # Patch to prevent file operation errors
 def patch_manim_file_operations():
     # Patch os.unlink to handle file not found errors safely
@@ -60,14 +63,25 @@ def safe_play(scene, *animations, **kwargs):
             pass
         scene.wait(kwargs.get("run_time", 1))
 
+# Scalar Newton iteration used by the scene (and by the kernel benchmarks)
+def newton_iterations(f, df, x0, iterations):
+    x_values = [x0]
+    for _ in range(iterations):
+        x_n = x_values[-1]
+        x_values.append(x_n - f(x_n) / df(x_n))
+    return x_values
+
 class NewtonMethodAnimation(Scene):
+    # The function to solve; f', f'' and the label are derived from it
+    function = "x**3 - 2*x**2 - 5"
+
     def construct(self):
         # Animation setup
         self.camera.background_color = "#1f1f1f"
         
         # Title and introduction with simpler subtitle
-        title = Text("牛顿迭代法 (Newton's Method)", font_size=48)
-        subtitle = Text("一种寻找方程解的强大方法", font_size=32)  # A powerful method to find equation solutions
+        title = cached_text("牛顿迭代法 (Newton's Method)", font_size=48)
+        subtitle = cached_text("一种寻找方程解的强大方法", font_size=32)  # A powerful method to find equation solutions
         subtitle.next_to(title, DOWN)
         
         self.play(Write(title), run_time=1.5)
@@ -75,7 +89,7 @@ class NewtonMethodAnimation(Scene):
         self.wait(1)
         
         # Brief explanation of what we're trying to do
-        explanation = Text("我们要找出函数等于0时的x值", font_size=32)  # We want to find x values where the function equals 0
+        explanation = cached_text("我们要找出函数等于0时的x值", font_size=32)  # We want to find x values where the function equals 0
         explanation.next_to(subtitle, DOWN, buff=0.5)
         self.play(FadeIn(explanation), run_time=1)
         self.wait(1.5)
@@ -92,17 +106,13 @@ class NewtonMethodAnimation(Scene):
         
         axes_labels = axes.get_axis_labels(x_label="x", y_label="f(x)")
         
-        # Define the function f(x) = x^3 - 2x^2 - 5
-        def f(x):
-            return x**3 - 2*x**2 - 5
-        
-        # Define the derivative f'(x) = 3x^2 - 4x
-        def df(x):
-            return 3*x**2 - 4*x
+        # f and its derivative f', compiled once from the symbolic expression
+        func = SymbolicFunction(self.function)
+        f, df = func.f, func.df
         
-        # Plot the function
-        graph = axes.plot(lambda x: f(x), color=BLUE)
-        graph_label = MathTex("f(x) = x^3 - 2x^2 - 5").scale(0.8)
+        # Plot the function (all samples evaluated in one vectorized call)
+        graph = axes.plot(f, color=BLUE, use_vectorized=True)
+        graph_label = MathTex(func.latex()).scale(0.8)
         graph_label.to_corner(UL).shift(RIGHT * 0.5 + DOWN * 0.5)
         
         # Add horizontal line at y=0
@@ -113,14 +123,14 @@ class NewtonMethodAnimation(Scene):
         self.play(Create(graph), Write(graph_label), Create(x_axis), run_time=2)
         
         # Explain what we're looking for
-        root_explanation = Text("方程的根是函数曲线与x轴的交点", font_size=28)  # The root is where the curve meets the x-axis
+        root_explanation = cached_text("方程的根是函数曲线与x轴的交点", font_size=28)  # The root is where the curve meets the x-axis
         root_explanation.to_edge(DOWN).shift(UP * 0.5)
         self.play(Write(root_explanation), run_time=1.5)
         self.wait(2)
         self.play(FadeOut(root_explanation), run_time=0.8)
         
         # Explain tangent line concept first
-        tangent_explanation = Text("牛顿发现可以用切线来逐步逼近函数的根", font_size=28)  # Newton found we can use tangent lines to approach the root
+        tangent_explanation = cached_text("牛顿发现可以用切线来逐步逼近函数的根", font_size=28)  # Newton found we can use tangent lines to approach the root
         tangent_explanation.to_edge(DOWN).shift(UP * 0.5)
         self.play(Write(tangent_explanation), run_time=1.5)
         self.wait(2)
@@ -138,7 +148,7 @@ class NewtonMethodAnimation(Scene):
         self.play(Create(sample_point), Create(sample_tangent), run_time=1.5)
         
         # Add labels for the tangent - position it better
-        tangent_label = Text("切线", font_size=22, color=GREEN)  # Tangent line
+        tangent_label = cached_text("切线", font_size=22, color=GREEN)  # Tangent line
         tangent_label.next_to(sample_point, UP+RIGHT, buff=0.2)
         self.play(Write(tangent_label), run_time=1)
         self.wait(1.5)
@@ -153,7 +163,7 @@ class NewtonMethodAnimation(Scene):
         )
         
         # Introduce Newton's method formula with explanation
-        formula_intro = Text("牛顿迭代法公式", font_size=32)  # Newton's method formula
+        formula_intro = cached_text("牛顿迭代法公式", font_size=32)  # Newton's method formula
         formula_intro.to_edge(DOWN).shift(UP * 0.5)
         self.play(Write(formula_intro), run_time=1)
         self.wait(0.5)
@@ -165,11 +175,11 @@ class NewtonMethodAnimation(Scene):
         
         # Explain the formula parts - make this smaller and position better
         formula_explanation = VGroup(
-            Text("这里:", font_size=22),  # Here:
-            Text("• x_n 是当前猜测值", font_size=20),  # is the current guess
-            Text("• f(x_n) 是函数在当前点的值", font_size=20),  # is the function value at current point
-            Text("• f'(x_n) 是函数在当前点的斜率", font_size=20),  # is the slope at current point
-            Text("• x_n+1 是下一个更好的猜测值", font_size=20)  # is the next, better guess
+            cached_text("这里:", font_size=22),  # Here:
+            cached_text("• x_n 是当前猜测值", font_size=20),  # is the current guess
+            cached_text("• f(x_n) 是函数在当前点的值", font_size=20),  # is the function value at current point
+            cached_text("• f'(x_n) 是函数在当前点的斜率", font_size=20),  # is the slope at current point
+            cached_text("• x_n+1 是下一个更好的猜测值", font_size=20)  # is the next, better guess
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.1)  # Reduced buffer between items
         formula_explanation.scale(0.75).to_corner(DL).shift(UP * 0.5 + RIGHT * 0.5)
         
@@ -180,7 +190,7 @@ class NewtonMethodAnimation(Scene):
         # Set up calculation area where we'll show each step - position better
         calc_box = Rectangle(width=5, height=3.2, color=WHITE, fill_opacity=0.1)
         calc_box.to_corner(UR).shift(LEFT * 0.3 + DOWN * 0.5)  # Moved further right to avoid formula
-        calc_title = Text("计算过程", font_size=22)  # Calculation Process - smaller
+        calc_title = cached_text("计算过程", font_size=22)  # Calculation Process - smaller
         calc_title.next_to(calc_box, UP, buff=0.1)
         self.play(Create(calc_box), Write(calc_title), run_time=1)
         
@@ -193,7 +203,7 @@ class NewtonMethodAnimation(Scene):
         current_x_label = MathTex(f"x_0 = {x0}").scale(0.8)
         current_x_label.next_to(current_dot, UP, buff=0.15)  # Better position
         
-        initial_guess_text = Text("我们从x₀=2.5开始尝试", font_size=28)  # We start with a guess x₀=2.5
+        initial_guess_text = cached_text("我们从x₀=2.5开始尝试", font_size=28)  # We start with a guess x₀=2.5
         initial_guess_text.to_edge(DOWN).shift(UP * 0.5)
         
         self.play(
@@ -206,20 +216,19 @@ class NewtonMethodAnimation(Scene):
         self.play(FadeOut(initial_guess_text), run_time=0.8)
         
         # Perform Newton's method iterations
-        x_values = [x0]
+        x_values = newton_iterations(f, df, x0, iterations)
         
         for i in range(iterations):
             # Current x and f(x)
-            x_n = x_values[-1]
+            x_n = x_values[i]
             y_n = f(x_n)
             
-            # Calculate the next x value using Newton's method
+            # The next x value from Newton's method
             slope_n = df(x_n)
-            x_next = x_n - y_n / slope_n
-            x_values.append(x_next)
+            x_next = x_values[i + 1]
             
             # Explanation for this iteration
-            iteration_text = Text(f"第{i+1}次迭代", font_size=28)  # Iteration #
+            iteration_text = cached_text(f"第{i+1}次迭代", font_size=28)  # Iteration #
             iteration_text.to_edge(DOWN).shift(UP * 0.5)
             self.play(Write(iteration_text), run_time=0.8)
             
@@ -228,7 +237,7 @@ class NewtonMethodAnimation(Scene):
                 MathTex(f"x_{i} = {x_n:.4f}"),
                 MathTex(f"f(x_{i}) = {y_n:.4f}"),
                 MathTex(f"f'(x_{i}) = {slope_n:.4f}"),
-                Text("代入公式:", font_size=20),  # Changed from MathTex to Text and smaller
+                cached_text("代入公式:", font_size=20),  # Changed from MathTex to Text and smaller
                 MathTex(f"x_{i+1} = x_{i} - \\frac{{f(x_{i})}}{{f'(x_{i})}}"),
                 MathTex(f"x_{i+1} = {x_n:.4f} - \\frac{{{y_n:.4f}}}{{{slope_n:.4f}}}"),
                 MathTex(f"x_{i+1} = {x_next:.4f}")
@@ -248,7 +257,7 @@ class NewtonMethodAnimation(Scene):
             )
             
             # Tangent label - better position
-            tangent_label = Text("切线", font_size=18, color=GREEN)  # Tangent line - smaller
+            tangent_label = cached_text("切线", font_size=18, color=GREEN)  # Tangent line - smaller
             
             # Position the label properly based on the position and avoid overlapping
             if y_n > 0:
@@ -267,7 +276,7 @@ class NewtonMethodAnimation(Scene):
             intersection_dot = Dot(axes.c2p(x_next, 0), color=RED)
             
             # Intersection label - better position
-            intersection_label = Text("切线与x轴的交点", font_size=18, color=RED)  # Intersection point - smaller
+            intersection_label = cached_text("切线与x轴的交点", font_size=18, color=RED)  # Intersection point - smaller
             
             # Position the intersection label to avoid overlapping
             if x_next < x_n:
@@ -292,7 +301,7 @@ class NewtonMethodAnimation(Scene):
             )
             
             # Better position for vertical label
-            vertical_label = Text("新的猜测值", font_size=18, color=YELLOW)  # New guess - smaller
+            vertical_label = cached_text("新的猜测值", font_size=18, color=YELLOW)  # New guess - smaller
             
             # Position the vertical label based on the direction of movement
             if f(x_next) > 0:
@@ -328,7 +337,7 @@ class NewtonMethodAnimation(Scene):
             
             # Add explanation of what happened - better position
             if i == 0:
-                explanation_text = Text("可以看到，我们的猜测值已经更接近根了！", font_size=22)  # Smaller
+                explanation_text = cached_text("可以看到，我们的猜测值已经更接近根了！", font_size=22)  # Smaller
                 explanation_text.next_to(iteration_text, UP, buff=0.2)
                 self.play(Write(explanation_text), run_time=1)
                 self.wait(1)
@@ -373,7 +382,7 @@ class NewtonMethodAnimation(Scene):
                 
         # Final explanation
         final_x = x_values[-1]
-        final_text = Text(f"经过{iterations}次迭代，我们找到了近似解: x ≈ {final_x:.6f}", font_size=26)  # Smaller
+        final_text = cached_text(f"经过{iterations}次迭代，我们找到了近似解: x ≈ {final_x:.6f}", font_size=26)  # Smaller
         final_text.to_edge(DOWN).shift(UP * 0.5)
         
         self.play(Write(final_text), run_time=1.5)
@@ -381,7 +390,7 @@ class NewtonMethodAnimation(Scene):
         
         # Check how close we are to the actual root
         f_final = f(final_x)
-        error_text = Text(f"此时 f(x) = {f_final:.8f} ≈ 0", font_size=22)  # Smaller
+        error_text = cached_text(f"此时 f(x) = {f_final:.8f} ≈ 0", font_size=22)  # Smaller
         error_text.next_to(final_text, UP, buff=0.2)
         self.play(Write(error_text), run_time=1.5)
         self.wait(1.5)
@@ -391,7 +400,7 @@ class NewtonMethodAnimation(Scene):
         
         # Highlight the root
         root_dot = Dot(axes.c2p(final_x, 0), color=GREEN, radius=0.12)
-        root_label = Text("方程的根", font_size=22, color=GREEN)  # Smaller
+        root_label = cached_text("方程的根", font_size=22, color=GREEN)  # Smaller
         root_label.next_to(root_dot, DOWN, buff=0.2)  # Better position
         
         self.play(
@@ -409,14 +418,14 @@ class NewtonMethodAnimation(Scene):
         # Summary of advantages - better position
         self.play(FadeOut(calc_box), FadeOut(calc_title), run_time=0.8)
         
-        advantages_title = Text("牛顿迭代法的优点", font_size=28)  # Smaller
+        advantages_title = cached_text("牛顿迭代法的优点", font_size=28)  # Smaller
         advantages_title.to_corner(UL).shift(DOWN * 1.5 + RIGHT * 1.0)  # 增加向下移动距离
         
         advantages = VGroup(
-            Text("• 收敛速度快", font_size=22),  # Smaller
-            Text("• 适用于许多函数", font_size=22),  
-            Text("• 计算简单", font_size=22),  
-            Text("• 在工程和科学中广泛应用", font_size=22)  
+            cached_text("• 收敛速度快", font_size=22),  # Smaller
+            cached_text("• 适用于许多函数", font_size=22),  
+            cached_text("• 计算简单", font_size=22),  
+            cached_text("• 在工程和科学中广泛应用", font_size=22)  
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)  # Reduced buffer
         advantages.next_to(advantages_title, DOWN, aligned_edge=LEFT, buff=0.25)
         
@@ -431,7 +440,7 @@ class NewtonMethodAnimation(Scene):
         self.wait(1.5)
         
         # Final conclusion
-        conclusion = Text("牛顿迭代法：以直线近似曲线，逐步逼近方程的解", font_size=28)  # Smaller
+        conclusion = cached_text("牛顿迭代法：以直线近似曲线，逐步逼近方程的解", font_size=28)  # Smaller
         conclusion.to_edge(DOWN).shift(UP * 0.5)
         
         self.play(
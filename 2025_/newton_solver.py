@@ -0,0 +1,98 @@
+"""
+Vectorized Newton's method over whole arrays of starting points.
+
+`newton_solve` iterates every start at once. Entries that converge or blow up
+are masked out, so later iterations only touch the points that are still
+moving. Works for real and complex inputs alike (f and df just have to accept
+NumPy arrays), which is what the basin and iteration-count pictures need.
+
+    result = newton_solve(f, df, np.linspace(-2, 3, 1_000_000))
+    result.roots, result.iterations, result.converged
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class NewtonResult(NamedTuple):
+    roots: np.ndarray            # last iterate of every start
+    iterations: np.ndarray       # Newton steps taken before stopping
+    converged: np.ndarray        # step size fell below tolerance
+    diverged: np.ndarray         # df == 0, non-finite or |x| > diverge_at
+    trajectories: Optional[np.ndarray] = None  # (max_iter + 1, *shape), held after stopping
+
+
+def newton_solve(f, df, x0, tol=1e-10, max_iter=50, diverge_at=1e12, return_trajectories=False):
+    """
+    Run Newton's method from every entry of `x0`.
+
+    A start converges once |x_{n+1} - x_n| <= tol * (1 + |x_n|) and diverges
+    when the step is not finite (df == 0) or the iterate leaves |x| <= diverge_at.
+    Starts that do neither within `max_iter` steps are reported as not converged.
+    With `return_trajectories`, row n of the trajectory is the iterate after n
+    steps; stopped entries keep their last value so every row can be plotted.
+    """
+    x0 = np.asarray(x0)
+    # floating inputs keep their precision (float32 / complex64 halve the memory); integers become float64
+    dtype = x0.dtype if np.issubdtype(x0.dtype, np.inexact) else np.result_type(x0, np.float64)
+    shape = x0.shape
+    x = x0.astype(dtype).ravel()
+
+    iterations = np.zeros(x.size, dtype=np.int32)
+    converged = np.zeros(x.size, dtype=bool)
+    diverged = np.zeros(x.size, dtype=bool)
+    trajectories = None
+    if return_trajectories:
+        trajectories = np.empty((max_iter + 1, x.size), dtype=dtype)
+        trajectories[0] = x
+
+    # indices of the entries that are still iterating
+    active = np.flatnonzero(np.isfinite(x))
+    diverged[~np.isfinite(x)] = True
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for n in range(1, max_iter + 1):
+            if active.size == 0:
+                if trajectories is not None:
+                    trajectories[n:] = x
+                break
+
+            xa = x[active]
+            step = f(xa) / df(xa)
+            x_next = xa - step
+
+            bad = ~np.isfinite(x_next) | (np.abs(x_next) > diverge_at)
+            done = np.abs(step) <= tol * (1 + np.abs(xa))
+
+            x[active] = np.where(bad, xa, x_next)
+            iterations[active] = n
+            diverged[active[bad]] = True
+            converged[active[done & ~bad]] = True
+            active = active[~(bad | done)]
+
+            if trajectories is not None:
+                trajectories[n] = x
+
+    result = NewtonResult(
+        roots=x.reshape(shape),
+        iterations=iterations.reshape(shape),
+        converged=converged.reshape(shape),
+        diverged=diverged.reshape(shape),
+    )
+    if trajectories is not None:
+        result = result._replace(trajectories=trajectories.reshape((max_iter + 1,) + shape))
+    return result
+
+
+def classify_roots(roots, known_roots, tol=1e-6):
+    """
+    Index of the nearest entry of `known_roots` for every root, or -1 when none
+    is within `tol`. Used to colour basins of attraction.
+    """
+    roots = np.asarray(roots)
+    known_roots = np.asarray(known_roots)
+    distance = np.abs(roots[..., None] - known_roots)
+    index = np.argmin(distance, axis=-1)
+    nearest = np.take_along_axis(distance, index[..., None], axis=-1)[..., 0]
+    return np.where(nearest <= tol, index, -1)
@@ -15,6 +15,17 @@ import logging
 # Get the directory of this script
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 ANIMATION_FILE = os.path.join(THIS_DIR, "newton_method.py")
+MEDIA_DIR = os.path.join(os.path.dirname(THIS_DIR), "media")
+
+# The media store (AppleDouble quarantine, size cap) is a command line tool in tools/
+MEDIA_STORE = os.path.join(os.path.dirname(THIS_DIR), "tools", "media_store.py")
+
+def quarantine_appledouble():
+    """Move aside AppleDouble "._*" files in the media directory, through tools/media_store.py."""
+    try:
+        subprocess.run([sys.executable, MEDIA_STORE, "--media-dir", MEDIA_DIR, "quarantine"], check=False)
+    except OSError as e:
+        print(f"Could not run {MEDIA_STORE}: {e}")
 
 def patch_manim_file_handling():
     """
@@ -78,12 +89,16 @@ def main():
     
     # Patch Manim's file handling
     patch_manim_file_handling()
+
+    # Move aside AppleDouble "._*" files before Manim lists the partial movie files
+    quarantine_appledouble()
         
     cmd = [
         "manim", 
         "--no_latex_cleanup",   # Prevent latex cleanup errors
         "--disable_caching",    # Prevent cache-related errors
         "-pqh",                 # preview, medium quality, 1080p
+        "--media_dir", MEDIA_DIR,
         ANIMATION_FILE,
         "NewtonMethodAnimation"
     ]
@@ -111,11 +126,8 @@ def main():
             return 0
         else:
             print(f"Animation rendering failed with exit code: {result.returncode}")
-            # Try to clean up any temp files that might be left
-            try:
-                os.system(f"find /Volumes/WD_BLACK/自媒体/manim_animation/my_math_animation/media -name '._*' -type f -delete")
-            except:
-                pass
+            # Move aside any AppleDouble files that might be left
+            quarantine_appledouble()
             return result.returncode
             
     except Exception as e:
@@ -0,0 +1,264 @@
+"""
+Side-by-side root finding: bisection, secant, Newton, Halley and Brent.
+
+Every method runs on a whole batch of brackets / starting points at once and
+records, for each entry, the error after every iteration and how many times
+f, f' and f'' were evaluated. Scenes can then plot convergence (log error
+against iteration or against evaluations) from the precomputed arrays instead
+of solving inside updaters.
+
+    func = SymbolicFunction("x**3 - 2*x**2 - 5")
+    results = compare_methods(func, a=2.0, b=3.0, root=2.6906474480286136)
+    results["halley"].errors[:, 0]      # error after 0, 1, 2, ... iterations
+
+Entries that have stopped keep their last iterate, so every row of `errors`
+is defined and the curves simply flatten out once a method has converged.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from newton_solver import newton_solve
+
+
+class RootFindingResult(NamedTuple):
+    method: str
+    roots: np.ndarray          # final estimate per entry, in the broadcast shape of the inputs
+    errors: np.ndarray         # (max_iter + 1, *shape) |x_n - root|, or |f(x_n)| without a reference root
+    evaluations: np.ndarray    # function evaluations (f, f' and f'' each count once) per entry
+    iterations: np.ndarray     # iterations until the stopping test passed
+    converged: np.ndarray
+
+
+def _evaluate(func, x, active, evaluations):
+    """func(x) on the active entries only; the rest are left at zero."""
+    out = np.zeros_like(x)
+    out[active] = func(x[active])
+    evaluations[active] += 1
+    return out
+
+
+def _flatten(*values):
+    """Broadcast the inputs together and flatten them to 1-D float arrays; also return the common shape."""
+    arrays = np.broadcast_arrays(*values)
+    return arrays[0].shape, [np.array(np.atleast_1d(v), dtype=float).ravel() for v in arrays]
+
+
+def _result(method, history, evaluations, iterations, converged, f, root, shape):
+    """Package the per-entry arrays, reshaped back to the broadcast shape of the inputs."""
+    history = np.asarray(history)
+    if root is None:
+        errors = np.abs(f(history))
+    else:
+        errors = np.abs(history - root)
+    return RootFindingResult(
+        method, history[-1].reshape(shape), errors.reshape((len(errors),) + shape),
+        evaluations.reshape(shape), iterations.reshape(shape), converged.reshape(shape),
+    )
+
+
+def _pad(history, max_iter):
+    """Hold the last row so every method reports max_iter + 1 rows."""
+    while len(history) < max_iter + 1:
+        history.append(history[-1])
+    return history
+
+
+def bisection(f, a, b, tol=1e-12, max_iter=50, root=None):
+    shape, (a, b) = _flatten(a, b)
+    n = a.size
+    evaluations = np.zeros(n, dtype=np.int32)
+    iterations = np.zeros(n, dtype=np.int32)
+    active = np.ones(n, dtype=bool)
+    fa = _evaluate(f, a, active, evaluations)
+    valid = np.sign(fa) != np.sign(_evaluate(f, b, active, evaluations))
+    active &= valid
+
+    history = [(a + b) / 2]
+    for i in range(1, max_iter + 1):
+        if not active.any():
+            break
+        m = (a + b) / 2
+        fm = _evaluate(f, m, active, evaluations)
+        left = np.sign(fm) == np.sign(fa)
+        a = np.where(active & left, m, a)
+        fa = np.where(active & left, fm, fa)
+        b = np.where(active & ~left, m, b)
+        iterations[active] = i
+        history.append(np.where(active, (a + b) / 2, history[-1]))
+        active &= ~((np.abs(b - a) <= tol) | (fm == 0))
+
+    return _result("bisection", _pad(history, max_iter), evaluations, iterations, valid & ~active,
+                   f, root, shape)
+
+
+def secant(f, x0, x1, tol=1e-12, max_iter=50, root=None):
+    shape, (x0, x1) = _flatten(x0, x1)
+    n = x0.size
+    evaluations = np.zeros(n, dtype=np.int32)
+    iterations = np.zeros(n, dtype=np.int32)
+    active = np.ones(n, dtype=bool)
+    converged = np.zeros(n, dtype=bool)
+    f0 = _evaluate(f, x0, active, evaluations)
+    f1 = _evaluate(f, x1, active, evaluations)
+
+    history = [x1.copy()]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(1, max_iter + 1):
+            if not active.any():
+                break
+            step = f1 * (x1 - x0) / (f1 - f0)
+            bad = active & ~np.isfinite(step)
+            active &= ~bad
+            x2 = np.where(active, x1 - step, x1)
+            f2 = _evaluate(f, x2, active, evaluations)
+            iterations[active] = i
+            x0, f0 = np.where(active, x1, x0), np.where(active, f1, f0)
+            x1, f1 = x2, np.where(active, f2, f1)
+            history.append(x1.copy())
+            done = active & (np.abs(step) <= tol * (1 + np.abs(x1)))
+            converged |= done
+            active &= ~done
+
+    return _result("secant", _pad(history, max_iter), evaluations, iterations, converged, f, root, shape)
+
+
+def newton(f, df, x0, tol=1e-12, max_iter=50, root=None):
+    shape, (x0,) = _flatten(x0)
+    result = newton_solve(f, df, x0, tol=tol, max_iter=max_iter, return_trajectories=True)
+    history = list(result.trajectories)
+    evaluations = 2 * result.iterations
+    return _result("newton", history, evaluations, result.iterations, result.converged, f, root, shape)
+
+
+def halley(f, df, d2f, x0, tol=1e-12, max_iter=50, root=None):
+    shape, (x,) = _flatten(x0)
+    n = x.size
+    evaluations = np.zeros(n, dtype=np.int32)
+    iterations = np.zeros(n, dtype=np.int32)
+    active = np.ones(n, dtype=bool)
+    converged = np.zeros(n, dtype=bool)
+
+    history = [x.copy()]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(1, max_iter + 1):
+            if not active.any():
+                break
+            fx = _evaluate(f, x, active, evaluations)
+            dfx = _evaluate(df, x, active, evaluations)
+            d2fx = _evaluate(d2f, x, active, evaluations)
+            step = 2 * fx * dfx / (2 * dfx ** 2 - fx * d2fx)
+            bad = active & ~np.isfinite(step)
+            active &= ~bad
+            x = np.where(active, x - step, x)
+            iterations[active] = i
+            history.append(x.copy())
+            done = active & (np.abs(step) <= tol * (1 + np.abs(x)))
+            converged |= done
+            active &= ~done
+
+    return _result("halley", _pad(history, max_iter), evaluations, iterations, converged, f, root, shape)
+
+
+def brent(f, a, b, tol=1e-12, max_iter=50, root=None):
+    """Brent's method (inverse quadratic / secant steps guarded by bisection), batched with masks."""
+    shape, (a, b) = _flatten(a, b)
+    n = a.size
+    evaluations = np.zeros(n, dtype=np.int32)
+    iterations = np.zeros(n, dtype=np.int32)
+    active = np.ones(n, dtype=bool)
+    fa = _evaluate(f, a, active, evaluations)
+    fb = _evaluate(f, b, active, evaluations)
+    # without a sign change there is nothing to bracket
+    valid = np.sign(fa) != np.sign(fb)
+    active &= valid
+
+    def keep_best_in_b(a, b, fa, fb):
+        swap = np.abs(fa) < np.abs(fb)
+        return np.where(swap, b, a), np.where(swap, a, b), np.where(swap, fb, fa), np.where(swap, fa, fb)
+
+    a, b, fa, fb = keep_best_in_b(a, b, fa, fb)
+    c, fc = a.copy(), fa.copy()
+    d = np.zeros(n)
+    bisected = np.ones(n, dtype=bool)
+
+    history = [b.copy()]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(1, max_iter + 1):
+            if not active.any():
+                break
+            interpolate = (fa != fc) & (fb != fc)
+            s_iqi = (a * fb * fc / ((fa - fb) * (fa - fc))
+                     + b * fa * fc / ((fb - fa) * (fb - fc))
+                     + c * fa * fb / ((fc - fa) * (fc - fb)))
+            s_secant = b - fb * (b - a) / (fb - fa)
+            s = np.where(interpolate, s_iqi, s_secant)
+            # an interpolation step this small means b has converged, even
+            # though the far end of the bracket may not have moved in
+            small_step = np.abs(s - b) <= tol * (1 + np.abs(b))
+
+            lo, hi = np.minimum((3 * a + b) / 4, b), np.maximum((3 * a + b) / 4, b)
+            bisect = (
+                ~((s > lo) & (s < hi))
+                | (bisected & (np.abs(s - b) >= np.abs(b - c) / 2))
+                | (~bisected & (np.abs(s - b) >= np.abs(c - d) / 2))
+                | (bisected & (np.abs(b - c) < tol))
+                | (~bisected & (np.abs(c - d) < tol))
+                | ~np.isfinite(s)
+            )
+            s = np.where(bisect, (a + b) / 2, s)
+            bisected = np.where(active, bisect, bisected)
+
+            fs = _evaluate(f, s, active, evaluations)
+            d = np.where(active, c, d)
+            c, fc = np.where(active, b, c), np.where(active, fb, fc)
+            left = np.sign(fa) != np.sign(fs)
+            b, fb = np.where(active & left, s, b), np.where(active & left, fs, fb)
+            a, fa = np.where(active & ~left, s, a), np.where(active & ~left, fs, fa)
+            a, b, fa, fb = keep_best_in_b(a, b, fa, fb)
+
+            iterations[active] = i
+            history.append(b.copy())
+            active &= ~((fb == 0) | (np.abs(b - a) <= tol) | small_step)
+
+    return _result("brent", _pad(history, max_iter), evaluations, iterations, valid & ~active,
+                   f, root, shape)
+
+
+METHODS = ("bisection", "secant", "newton", "halley", "brent")
+
+
+def compare_methods(func, a, b, x0=None, root=None, methods=METHODS, tol=1e-12, max_iter=50):
+    """
+    Run several methods on the same function and batch of brackets [a, b].
+
+    `func` provides `f`, `df` and `d2f` (a `SymbolicFunction`, for instance).
+    Bracketing methods use [a, b]; secant starts from (a, b); Newton and
+    Halley start from `x0`, which defaults to `b`. Returns {method: result}.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float).ravel(), np.asarray(b, dtype=float).ravel())
+    x0 = b if x0 is None else np.broadcast_to(np.asarray(x0, dtype=float).ravel(), a.shape)
+    options = dict(tol=tol, max_iter=max_iter, root=root)
+
+    runners = {
+        "bisection": lambda: bisection(func.f, a, b, **options),
+        "secant": lambda: secant(func.f, a, b, **options),
+        "newton": lambda: newton(func.f, func.df, x0, **options),
+        "halley": lambda: halley(func.f, func.df, func.d2f, x0, **options),
+        "brent": lambda: brent(func.f, a, b, **options),
+    }
+    return {name: runners[name]() for name in methods}
+
+
+def convergence_order(errors, floor=1e-14):
+    """
+    Per-step estimate of the order q from e_{n+1} ~ C e_n^q, i.e.
+    log(e_{n+1}/e_n) / log(e_n/e_{n-1}). Steps whose errors are already at
+    `floor` (or have stopped changing) are NaN.
+    """
+    e = np.asarray(errors, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_e = np.log(np.where(e > floor, e, np.nan))
+        q = (log_e[2:] - log_e[1:-1]) / (log_e[1:-1] - log_e[:-2])
+    return np.where(np.isfinite(q), q, np.nan)
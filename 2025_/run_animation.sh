@@ -12,20 +12,26 @@ echo "=== Newton Method Animation Runner ==="
 echo "This script will run the animation with safety measures"
 echo ""
 
-# Clean up any problematic files that might be causing issues
-echo "Cleaning up any problematic cache files..."
-find ../media -name "._*" -type f -delete 2>/dev/null || true
+# Quarantine AppleDouble "._*" files that trip Manim and keep the media directory under its size cap
+echo "Tidying the media directory..."
+python ../tools/media_store.py --media-dir ../media gc --quiet || true
 
-# Run the animation with safe settings
-echo "Starting animation with safe settings..."
-python render_newton.py
+# Re-render only if the scene or a module it imports changed since the last build
+echo "Building animation (skipped when its sources are unchanged)..."
+python ../tools/build.py newton_method.py::NewtonMethodAnimation -q h
 
-# If the animation fails, try the direct approach
+# If the build fails, run the animation with safe settings
 if [ $? -ne 0 ]; then
-    echo "Trying alternative rendering method..."
-    manim --no_latex_cleanup --disable_caching -pqh newton_method.py NewtonMethodAnimation
+    echo "Starting animation with safe settings..."
+    python render_newton.py
+
+    # If the animation fails, try the direct approach
+    if [ $? -ne 0 ]; then
+        echo "Trying alternative rendering method..."
+        manim --no_latex_cleanup --disable_caching -pqh newton_method.py NewtonMethodAnimation
+    fi
 fi
 
 echo ""
 echo "Animation rendering completed"
-echo "Check the 'media' directory for the output video" 
\ No newline at end of file
+echo "Check the 'media/build' directory (see manifest.json) for the output video" 
\ No newline at end of file
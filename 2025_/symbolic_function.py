@@ -0,0 +1,68 @@
+"""
+One symbolic source for a scene's function, its derivatives and its label.
+
+    func = SymbolicFunction("x**3 - 2*x**2 - 5")
+    func.f(xs), func.df(xs), func.d2f(xs)     # vectorized NumPy callables
+    func.latex()                               # "f(x) = x^{3} - 2 x^{2} - 5"
+
+Derivatives are taken with SymPy and every expression is compiled once with
+`lambdify`; the compiled callables are cached by expression, so building the
+same function again (in another scene, or per frame) costs nothing.
+"""
+
+import functools
+
+import numpy as np
+import sympy as sp
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(expr, symbol):
+    compiled = sp.lambdify(symbol, expr, modules="numpy")
+    if expr.free_symbols:
+        return compiled
+
+    # Constants (e.g. the derivative of a line) must still broadcast over arrays
+    value = compiled(0)
+    dtype = np.result_type(value, float)
+    return lambda x: np.full(np.shape(x), value, dtype=dtype)[()]
+
+
+class SymbolicFunction:
+    """A function of one variable given as a SymPy expression or a string."""
+
+    def __init__(self, expression, variable="x"):
+        self.symbol = sp.Symbol(variable)
+        self.expr = sp.sympify(expression, locals={variable: self.symbol})
+        extra = self.expr.free_symbols - {self.symbol}
+        if extra:
+            raise ValueError(f"{expression!r} depends on {sorted(map(str, extra))}, expected only {variable}")
+
+    def __repr__(self):
+        return f"SymbolicFunction({str(self.expr)!r})"
+
+    def derivative(self, order=1):
+        return sp.diff(self.expr, self.symbol, order)
+
+    def compile(self, order=0):
+        """Vectorized NumPy callable for the `order`-th derivative."""
+        expr = self.expr if order == 0 else self.derivative(order)
+        return _compile(expr, self.symbol)
+
+    @property
+    def f(self):
+        return self.compile(0)
+
+    @property
+    def df(self):
+        return self.compile(1)
+
+    @property
+    def d2f(self):
+        return self.compile(2)
+
+    def latex(self, name="f", order=0):
+        """`f(x) = ...` for the `order`-th derivative, ready for `MathTex`."""
+        expr = self.expr if order == 0 else self.derivative(order)
+        prime = "'" * order
+        return f"{name}{prime}({sp.latex(self.symbol)}) = {sp.latex(expr)}"
@@ -0,0 +1,55 @@
+"""
+Text atlas: lay out each distinct `Text` once and hand out copies.
+
+Pango layout plus SVG parsing dominates construct time in the CJK-heavy
+scenes, and the same strings ("切线", axis labels, ...) come back again and
+again, within a scene, across scenes and across renders. The atlas keys every
+label by (string, style kwargs, Manim version), keeps recently used ones in
+memory, and pickles them to disk so later renders skip Pango entirely.
+
+    from text_atlas import cached_text
+    label = cached_text("切线", font_size=22, color=GREEN)
+
+The disk cache lives in `<media_dir>/text_atlas` and is trimmed LRU-first once
+it holds more than `max_files` entries or `max_bytes` bytes. Parallel renders
+can share it safely (see shared/pickle_cache.py).
+"""
+
+import hashlib
+import os
+import sys
+
+from manim import Text, __version__ as manim_version, config
+
+# the pickled LRU store shared with the grid factory lives in the repository-level `shared` package
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.append(REPO_DIR)
+from shared.pickle_cache import PickleCache
+
+
+class TextAtlas(PickleCache):
+    def __init__(self, cache_dir=None, max_memory=1024, max_files=4096, max_bytes=256 * 1024 * 1024):
+        super().__init__(cache_dir, max_memory, max_files, max_bytes)
+
+    @property
+    def cache_dir(self):
+        # resolved lazily so command line options (--media_dir) are honoured
+        return self._cache_dir or os.path.join(config.media_dir, "text_atlas")
+
+    @staticmethod
+    def key(text, kwargs):
+        style = ",".join(f"{name}={kwargs[name]!r}" for name in sorted(kwargs))
+        return hashlib.sha1(f"{manim_version}\0{text}\0{style}".encode("utf-8")).hexdigest()
+
+    def get(self, text, **kwargs):
+        """A fresh copy of `Text(text, **kwargs)`, laid out at most once."""
+        return self.fetch(self.key(text, kwargs), lambda: Text(text, **kwargs))
+
+
+default_atlas = TextAtlas()
+
+
+def cached_text(text, **kwargs):
+    """Drop-in for `Text(text, **kwargs)` backed by the shared atlas."""
+    return default_atlas.get(text, **kwargs)
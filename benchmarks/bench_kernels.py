@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+"""
+Microbenchmarks for the math kernels behind the scenes.
+
+Every case is swept over the parameter that drives its cost (resolution,
+curve degree, t-array size, surface sampling density, iteration count) and
+timed with `timeit`. Results can be stored as a baseline and later runs are
+compared against it:
+
+    python benchmarks/bench_kernels.py --save          # record baseline.json
+    python benchmarks/bench_kernels.py                 # compare, exit 1 on regression
+    python benchmarks/bench_kernels.py -k bezier -t 1.5
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(THIS_DIR)
+BASELINE_FILE = os.path.join(THIS_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 1.25
+
+_modules = {}
+
+
+def load_module(relative_path):
+    """Import a scene module by its path (the year folders are not packages)."""
+    if relative_path not in _modules:
+        path = os.path.join(REPO_DIR, relative_path)
+        name = "bench_" + os.path.splitext(os.path.basename(path))[0]
+        sys.path.insert(0, os.path.dirname(path))
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[relative_path] = module
+    return _modules[relative_path]
+
+
+def random_control_points(degree, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-5, 5, size=(degree + 1, 3))
+    points[:, 2] = 0
+    return points
+
+
+# Each case maps a parameter dict to a zero-argument callable to be timed.
+
+def case_bezier_points(resolution, degree):
+    bezier = load_module("2024_/bezier.py")
+    path = bezier.BezierPath(random_control_points(degree), resolution=resolution)
+    return path.get_bezier_points
+
+
+def case_uniform_samples(resolution, degree):
+    bezier = load_module("2024_/bezier.py")
+    path = bezier.BezierPath(random_control_points(degree), dot_num=20, resolution=resolution)
+    return path.get_uniformly_sampled_points
+
+
+def case_linear_interpolation(size):
+    interpolation = load_module("2024_/interpolation.py")
+    A, B = random_control_points(1)
+    t = np.linspace(0, 1, size)[:, None]
+    return lambda: interpolation.Utils.linear_interpolation(A, B, t)
+
+
+def case_bezier_interpolation(size):
+    interpolation = load_module("2024_/interpolation.py")
+    control_points = random_control_points(3)
+    t = np.linspace(0, 1, size)[:, None]
+    return lambda: interpolation.Utils.bezier_interpolation(control_points, t)
+
+
+def case_cube_frame(increment_speed):
+    cube = load_module("2025_/interactive_rotating_cube/rotation_cube.py")
+    cube.A, cube.B, cube.C = 0.3, 0.2, 0.1
+    w = cube.cube_width
+
+    def frame():
+        cube.buffer.fill(cube.bg_ascii)
+        cube.z_buffer.fill(0)
+        for cube_x in np.arange(-w, w, increment_speed):
+            for cube_y in np.arange(-w, w, increment_speed):
+                cube.calculate_plane(cube_x, cube_y, -w, '@')
+                cube.calculate_plane(w, cube_y, cube_x, '$')
+                cube.calculate_plane(-w, cube_y, -cube_x, '~')
+                cube.calculate_plane(-cube_x, cube_y, w, '#')
+                cube.calculate_plane(cube_x, -w, -cube_y, ';')
+                cube.calculate_plane(cube_x, w, cube_y, '+')
+    return frame
+
+
+def case_cube_render_frame(increment_speed):
+    cube = load_module("2025_/interactive_rotating_cube/rotation_cube.py")
+    cube.A, cube.B, cube.C = 0.3, 0.2, 0.1
+
+    def frame():
+        cube.increment_speed = increment_speed
+        cube.render_frame()
+    return frame
+
+
+def case_cube_parallel(increment_speed, workers):
+    cube = load_module("2025_/interactive_rotating_cube/rotation_cube.py")
+    parallel = load_module("2025_/interactive_rotating_cube/ascii_parallel.py")
+    cube.A, cube.B, cube.C = 0.3, 0.2, 0.1
+    cube.increment_speed = increment_speed
+    # large terminal; threads because the modules loaded here cannot be pickled by name
+    screen = (400, 150, cube.horizontal_offset, cube.K1 * 150 / cube.height)
+    rasterizer = parallel.ParallelRasterizer(cube.project_points, 400, 150, workers, processes=False)
+    rasterizer.set_points(cube.get_geometry().points)
+    R = cube.get_rotation_matrix()
+    return lambda: rasterizer.render(R, screen)
+
+
+def case_donut_render(phi_step):
+    donut = load_module("2025_/interactive_rotating_cube/rotation_donut.py")
+    renderer = donut.DonutRenderer(phi_step=phi_step)
+    return lambda: renderer.render(1.0, 0.5)
+
+
+def case_rotation_matrix():
+    cube = load_module("2025_/interactive_rotating_cube/rotation_cube.py")
+    return cube.get_rotation_matrix
+
+
+def case_euler_track(frames):
+    rotations = load_module("2025_/interactive_rotating_cube/rotations.py")
+    angles = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(frames, 3))
+    return lambda: rotations.euler_to_matrix(angles, "xyz")
+
+
+def case_slerp_track(frames):
+    rotations = load_module("2025_/interactive_rotating_cube/rotations.py")
+    q0, q1 = rotations.euler_to_quaternion([[0.1, 0.2, 0.3], [1.0, -0.5, 2.0]])
+    t = np.linspace(0, 1, frames)
+    return lambda: rotations.quaternion_to_matrix(rotations.slerp(q0, q1, t))
+
+
+def newton_f(x):
+    return x**3 - 2*x**2 - 5
+
+
+def newton_df(x):
+    return 3*x**2 - 4*x
+
+
+def case_newton_iterations(iterations):
+    newton = load_module("2025_/newton_method.py")
+    return lambda: newton.newton_iterations(newton_f, newton_df, 2.5, iterations)
+
+
+def case_newton_solve(size):
+    solver = load_module("2025_/newton_solver.py")
+    x0 = np.linspace(-2, 3, size)
+    return lambda: solver.newton_solve(newton_f, newton_df, x0)
+
+
+def case_newton_fractal(width):
+    fractal = load_module("2025_/newton_fractal.py")
+    renderer = fractal.NewtonFractal([1, 0, 0, -1], workers=1)
+    return lambda: renderer.render(shape=(width * 9 // 16, width))
+
+
+CASES = [
+    ("bezier.get_bezier_points", case_bezier_points,
+     [dict(resolution=r, degree=d) for r in (100, 1000, 10000) for d in (3, 7, 15)]),
+    ("bezier.get_uniformly_sampled_points", case_uniform_samples,
+     [dict(resolution=r, degree=3) for r in (100, 1000, 10000)]),
+    ("interpolation.linear_interpolation", case_linear_interpolation,
+     [dict(size=n) for n in (10**3, 10**5, 10**6)]),
+    ("interpolation.bezier_interpolation", case_bezier_interpolation,
+     [dict(size=n) for n in (10**3, 10**5, 10**6)]),
+    ("rotation_cube.get_rotation_matrix", case_rotation_matrix, [{}]),
+    ("rotations.euler_to_matrix", case_euler_track,
+     [dict(frames=n) for n in (1, 60, 10**4)]),
+    ("rotations.slerp", case_slerp_track,
+     [dict(frames=n) for n in (1, 60, 10**4)]),
+    ("rotation_cube.frame", case_cube_frame,
+     [dict(increment_speed=s) for s in (2.0, 1.0, 0.6)]),
+    ("rotation_cube.render_frame", case_cube_render_frame,
+     [dict(increment_speed=s) for s in (2.0, 1.0, 0.6, 0.2)]),
+    ("ascii_parallel.render", case_cube_parallel,
+     [dict(increment_speed=s, workers=w) for s in (0.6, 0.2) for w in (1, 4)]),
+    ("rotation_donut.render", case_donut_render,
+     [dict(phi_step=s) for s in (0.02, 0.005)]),
+    ("newton_method.newton_iterations", case_newton_iterations,
+     [dict(iterations=n) for n in (4, 100, 10000)]),
+    ("newton_solver.newton_solve", case_newton_solve,
+     [dict(size=n) for n in (10**3, 10**5, 10**6)]),
+    ("newton_fractal.render", case_newton_fractal,
+     [dict(width=w) for w in (480, 1920)]),
+]
+
+
+def case_id(name, params):
+    if not params:
+        return name
+    return name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+
+
+def time_call(func, repeat, min_time):
+    """Best per-call time in seconds over `repeat` rounds of at least `min_time`."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern=None, repeat=5, min_time=0.2):
+    results = {}
+    for name, factory, sweep in CASES:
+        for params in sweep:
+            cid = case_id(name, params)
+            if pattern and pattern not in cid:
+                continue
+            try:
+                func = factory(**params)
+            except ImportError as e:
+                print(f"{cid:<60} skipped ({e})")
+                continue
+            seconds = time_call(func, repeat, min_time)
+            results[cid] = seconds
+            print(f"{cid:<60} {seconds * 1e3:12.4f} ms")
+    return results
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def save_baseline(path, results):
+    baseline = load_baseline(path) or {"machine": {}, "results": {}}
+    baseline["machine"] = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+    baseline["results"].update(results)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(baseline, fp, indent=2, sort_keys=True)
+    print(f"Saved {len(results)} results to {path}")
+
+
+def compare(results, baseline, threshold):
+    """Print ratios against the baseline and return the ids that regressed."""
+    regressions = []
+    print()
+    print(f"{'case':<60} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for cid, seconds in results.items():
+        base = baseline["results"].get(cid)
+        if base is None:
+            print(f"{cid:<60} {'-':>12} {seconds * 1e3:10.4f}ms {'new':>7}")
+            continue
+        ratio = seconds / base
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(cid)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{cid:<60} {base * 1e3:10.4f}ms {seconds * 1e3:10.4f}ms {ratio:7.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run cases whose id contains this string")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio that counts as a regression (default: %(default)s)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline file (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="minimum seconds per timing round (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat, args.min_time)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save to create one.")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold}x baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
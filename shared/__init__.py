@@ -0,0 +1,11 @@
+"""
+Helpers shared by the scene folders (2024_/, 2025_/, ...) at render time.
+
+Scene files are run as scripts with only their own folder on sys.path, so
+modules that use this package append the repository root first:
+
+    sys.path.append(REPO_DIR)
+    from shared.pickle_cache import PickleCache
+
+The command line tools stay in tools/.
+"""
@@ -0,0 +1,131 @@
+"""
+Prototype cache shared by the text atlas and the grid factory.
+
+Values are built once, kept in an in-memory LRU and pickled to a cache
+folder, so later scenes and later renders only pay for `copy()`. The folder
+may be shared by several processes (`tools/build.py -j N`): entries are
+written to a unique temporary file and moved into place atomically, and a
+file that another process already replaced or removed is simply skipped.
+
+    class TextAtlas(PickleCache):
+        def get(self, text, **kwargs):
+            return self.fetch(self.key(text, kwargs), lambda: Text(text, **kwargs))
+
+The folder is trimmed LRU-first (by modification time, refreshed on every
+load) once it holds more than `max_files` entries or `max_bytes` bytes.
+"""
+
+import collections
+import os
+import pickle
+import tempfile
+
+SUFFIX = ".pkl"
+
+
+def remove_quietly(path):
+    """Remove `path` unless another process got there first."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class PickleCache:
+    def __init__(self, cache_dir=None, max_memory=1024, max_files=4096, max_bytes=None):
+        self._cache_dir = cache_dir
+        self.max_memory = max_memory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._memory = collections.OrderedDict()
+        self.hits = self.disk_hits = self.misses = 0
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def fetch(self, key, build):
+        """A fresh copy of the value cached under `key`, calling `build()` only if there is none."""
+        prototype = self._memory.get(key)
+        if prototype is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return prototype.copy()
+
+        prototype = self._load(key)
+        if prototype is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            prototype = build()
+            self._store(key, prototype)
+
+        self._memory[key] = prototype
+        if len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+        return prototype.copy()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + SUFFIX)
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fp:
+                prototype = pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # stale or truncated entry: drop it and build the value again
+            remove_quietly(path)
+            return None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except FileNotFoundError:
+            pass  # evicted by another process since; the loaded value is still good
+        return prototype
+
+    def _store(self, key, prototype):
+        try:
+            data = pickle.dumps(prototype, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return  # not picklable: keep it in memory only
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # a name of its own, so concurrent writers of the same key never share a temporary file
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=key, suffix=".tmp", delete=False) as fp:
+            fp.write(data)
+        try:
+            os.replace(fp.name, self._path(key))
+        except OSError:
+            remove_quietly(fp.name)
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used files until the disk cache is within its limits."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            return
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_files
+                           or (self.max_bytes is not None and total > self.max_bytes)):
+            _, size, path = entries.pop(0)
+            remove_quietly(path)
+            total -= size
+
+    def clear(self, disk=False):
+        self._memory.clear()
+        if disk and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(SUFFIX):
+                    remove_quietly(os.path.join(self.cache_dir, name))
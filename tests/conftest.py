@@ -0,0 +1,8 @@
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the scene folders are script folders, imported the way `manim <file>` does: with the folder on sys.path
+for folder in ("2025_", os.path.join("2025_", "interactive_rotating_cube")):
+    sys.path.insert(0, os.path.join(REPO_DIR, folder))
@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+from frame_governor import FrameGovernor
+
+
+def budget(governor, ratio):
+    """Average render time that is `ratio` times the governor's work budget."""
+    return ratio * governor.headroom * governor.frame_period
+
+
+def test_zero_work_drops_to_the_finest_rung():
+    governor = FrameGovernor(60, sample_step=0.6, min_step=0.2, max_step=4.0)
+    governor._retune(0.0)
+    assert governor.rung == governor.min_rung
+    assert governor.min_step <= governor.sample_step < governor.base_step
+
+
+def test_steps_stay_on_the_ladder():
+    governor = FrameGovernor(60, sample_step=0.6, min_step=0.2, max_step=4.0)
+    seen = set()
+    for ratio in (3.0, 0.3, 5.0, 1.5, 0.0, 2.0, 0.5):
+        governor._retune(budget(governor, ratio))
+        seen.add(governor.sample_step)
+        assert governor.sample_step == pytest.approx(governor.base_step * governor.step_ratio ** governor.rung)
+        assert governor.min_step <= governor.sample_step <= governor.max_step
+    # each rung maps to exactly one float, so the geometry cache sees repeatable keys
+    for step in seen:
+        rung = round(math.log(step / governor.base_step, governor.step_ratio))
+        assert step == governor.base_step * governor.step_ratio ** rung
+
+
+def test_dead_band_keeps_the_step():
+    governor = FrameGovernor(60, sample_step=0.6)
+    governor._retune(budget(governor, 0.9))
+    assert governor.rung == 0 and governor.sample_step == 0.6
+
+
+def test_slightly_over_budget_moves_one_rung_coarser():
+    governor = FrameGovernor(60, sample_step=0.6)
+    governor._retune(budget(governor, 1.15))
+    assert governor.rung == 1
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import root_finding
+
+ROOT = np.sqrt(5.0)
+
+
+def f(x):
+    return x ** 2 - 5
+
+
+def df(x):
+    return 2 * x
+
+
+def d2f(x):
+    return np.full_like(x, 2.0)
+
+
+METHODS = {
+    "bisection": lambda a, b: root_finding.bisection(f, a, b, root=ROOT),
+    "secant": lambda a, b: root_finding.secant(f, a, b, root=ROOT),
+    "newton": lambda a, b: root_finding.newton(f, df, b, root=ROOT),
+    "halley": lambda a, b: root_finding.halley(f, df, d2f, b, root=ROOT),
+    "brent": lambda a, b: root_finding.brent(f, a, b, root=ROOT),
+}
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_scalar_bracket(method):
+    result = METHODS[method](2.0, 3.0)
+    assert result.roots.shape == ()
+    assert result.errors.shape == (51,)
+    assert result.converged
+    assert result.roots == pytest.approx(ROOT, abs=1e-10)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_2d_brackets_keep_their_shape(method):
+    a, b = np.full((2, 3), 2.0), np.full((2, 3), 3.0)
+    result = METHODS[method](a, b)
+    assert result.roots.shape == (2, 3)
+    assert result.errors.shape == (51, 2, 3)
+    assert result.evaluations.shape == result.iterations.shape == result.converged.shape == (2, 3)
+    assert result.converged.all()
+    np.testing.assert_allclose(result.roots, ROOT, atol=1e-10)
+
+
+def test_brackets_broadcast():
+    result = root_finding.brent(f, np.array([[2.0], [1.0]]), np.array([3.0, 4.0, 5.0]))
+    assert result.roots.shape == (2, 3)
+    assert result.converged.all()
+
+
+def test_bracket_without_sign_change_does_not_converge():
+    result = root_finding.bisection(f, [2.0, 3.0], [3.0, 4.0])
+    assert result.converged.tolist() == [True, False]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+"""
+Incremental scene builds keyed by content hash.
+
+Every scene gets a hash of what its video depends on:
+
+    - its class, its local base classes and the rest of its file except
+      the other scene classes (helpers such as `Utils` or `BezierPath`)
+    - every repository module its file imports, transitively
+      (grid_factory, text_atlas, rotations, ...)
+    - the render options and the Manim version
+
+Sources are hashed as ASTs, so editing comments or formatting does not
+trigger a render. Scenes whose hash already has an output in the store are
+skipped; the rest are rendered, each in its own process, and their videos
+moved to `<out>/<hash>/<Scene>.mp4`. `<out>/manifest.json` maps each scene
+to its current hash and output, so reverting an edit reuses the old video.
+
+    python tools/build.py                        # every scene, low quality
+    python tools/build.py 2024_ -q h -j 4
+    python tools/build.py 2024_/main.py::BezierScene --dry-run
+"""
+
+import argparse
+import ast
+import concurrent.futures
+import functools
+import glob
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from dry_run import REPO_DIR
+from scenes import QUALITIES, default_paths, discover, local_imports, parse, scan_file, select
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT = os.path.join(REPO_DIR, "media", "build")
+DEFAULT_MEDIA = os.path.join(REPO_DIR, "media")
+
+
+@functools.lru_cache(maxsize=None)
+def manim_version():
+    try:
+        return importlib.metadata.version("manim")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def dump(node):
+    """Source-independent form of an AST node: no comments, no line numbers."""
+    return ast.dump(node, include_attributes=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def module_digest(path):
+    tree = parse(path)
+    if tree is None:
+        with open(path, "rb") as fp:
+            return hashlib.sha256(fp.read()).hexdigest()
+    return hashlib.sha256(dump(tree)).hexdigest()
+
+
+def transitive_imports(path):
+    """Every repository module `path` imports, directly or through other local modules."""
+    found = set()
+    pending = [path]
+    while pending:
+        for target in local_imports(pending.pop()).values():
+            target = os.path.abspath(target)
+            if target not in found and target != os.path.abspath(path):
+                found.add(target)
+                pending.append(target)
+    return sorted(found)
+
+
+def scene_source(info):
+    """The parts of the scene's file it depends on, as one bytes blob."""
+    tree = parse(info.path)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    # the scene and the classes of this file it derives from
+    keep, pending = set(), [info.name]
+    while pending:
+        name = pending.pop()
+        if name in classes and name not in keep:
+            keep.add(name)
+            pending.extend(base.id for base in classes[name].bases if isinstance(base, ast.Name))
+    other_scenes = {scene.name for scene in scan_file(info.path)} - keep
+    return b"\n".join(
+        dump(node) for node in tree.body
+        if not (isinstance(node, ast.ClassDef) and node.name in other_scenes)
+    )
+
+
+def scene_hash(info, options):
+    digest = hashlib.sha256()
+    digest.update(json.dumps(dict(options, manim=manim_version()), sort_keys=True).encode("utf-8"))
+    digest.update(scene_source(info))
+    for path in transitive_imports(info.path):
+        digest.update(os.path.relpath(path, REPO_DIR).encode("utf-8"))
+        digest.update(module_digest(path).encode("ascii"))
+    return digest.hexdigest()[:20]
+
+
+class Manifest:
+    """`<out>/manifest.json`: selector -> {hash, output, seconds, built}."""
+
+    def __init__(self, out):
+        self.out = out
+        self.path = os.path.join(out, "manifest.json")
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                self.entries = json.load(fp)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    def stored_output(self, info, digest):
+        """Path of the stored video (or image) for this hash, if there is one."""
+        for extension in (".mp4", ".png"):
+            path = os.path.join(self.out, digest, info.name + extension)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def record(self, info, digest, output, seconds):
+        self.entries[info.selector] = {
+            "hash": digest,
+            "output": os.path.relpath(output, self.out),
+            "seconds": round(seconds, 2),
+            "built": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def save(self):
+        os.makedirs(self.out, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(self.entries, fp, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def find_output(info, media_dir, since):
+    """The video (or last-frame image) Manim wrote for this scene after `since`."""
+    stem = os.path.splitext(os.path.basename(info.path))[0]
+    # videos are named after the scene, last-frame images get a version suffix
+    for folder, name in (("videos", info.name + ".mp4"), ("images", info.name + "_*.png")):
+        pattern = os.path.join(media_dir, folder, stem, "**", name)
+        candidates = [
+            path for path in glob.glob(pattern, recursive=True)
+            if "partial_movie_files" not in path and os.path.getmtime(path) >= since
+        ]
+        if candidates:
+            return max(candidates, key=os.path.getmtime)
+    return None
+
+
+def render(info, digest, options, out, media_dir):
+    """Render one scene in a subprocess and move its output into the store; return (path, seconds, log)."""
+    command = [
+        sys.executable, os.path.join(THIS_DIR, "scenes.py"), "render", info.selector,
+        "-q", options["quality"], "--media-dir", media_dir,
+    ]
+    start = time.time()
+    result = subprocess.run(command, cwd=REPO_DIR, capture_output=True, text=True)
+    seconds = time.time() - start
+    output = find_output(info, media_dir, start - 1) if result.returncode == 0 else None
+    if output is None:
+        return None, seconds, result.stdout + result.stderr
+
+    target = os.path.join(out, digest, info.name + os.path.splitext(output)[1])
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.move(output, target)
+    return target, seconds, ""
+
+
+def resolve_targets(targets):
+    if not targets:
+        return discover(default_paths())
+    scenes = []
+    for target in targets:
+        found = discover([target]) if os.path.isdir(target) else select(target)
+        if not found:
+            print(f"No scene matches {target!r}")
+        scenes.extend(s for s in found if s not in scenes)
+    return scenes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="*",
+                        help="folders, files or file.py::Scene selectors (default: every scene)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l",
+                        help="render quality as in `manim -q` (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="scenes rendered in parallel")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output store and manifest (default: media/build)")
+    parser.add_argument("--media-dir", default=DEFAULT_MEDIA,
+                        help="Manim media directory used while rendering (default: media)")
+    parser.add_argument("--force", action="store_true", help="render even if the hash is unchanged")
+    parser.add_argument("--dry-run", action="store_true", help="only show which scenes would be rendered")
+    args = parser.parse_args(argv)
+
+    options = {"quality": args.quality}
+    manifest = Manifest(args.out)
+    scenes = resolve_targets(args.targets)
+    if not scenes:
+        return 1
+
+    pending = []
+    for info in scenes:
+        digest = scene_hash(info, options)
+        stored = manifest.stored_output(info, digest)
+        if stored and not args.force:
+            previous = manifest.entries.get(info.selector, {}).get("hash")
+            status = "up to date" if previous == digest else "reuse"
+            if previous != digest:
+                manifest.record(info, digest, stored, 0)
+            print(f"{status:<11} {info.selector}  {os.path.relpath(stored, REPO_DIR)}")
+        else:
+            print(f"{'render':<11} {info.selector}  [{digest}]")
+            pending.append((info, digest))
+
+    if args.dry_run or not pending:
+        if not args.dry_run:
+            manifest.save()
+        return 0
+
+    failed = 0
+    with concurrent.futures.ThreadPoolExecutor(max(1, args.jobs)) as pool:
+        futures = {
+            pool.submit(render, info, digest, options, args.out, args.media_dir): (info, digest)
+            for info, digest in pending
+        }
+        for future in concurrent.futures.as_completed(futures):
+            info, digest = futures[future]
+            output, seconds, log = future.result()
+            if output is None:
+                failed += 1
+                print(f"{'failed':<11} {info.selector}  ({seconds:.1f}s)\n{log}")
+                continue
+            manifest.record(info, digest, output, seconds)
+            # save after every scene so an interrupted build keeps what it finished
+            manifest.save()
+            print(f"{'built':<11} {info.selector}  {os.path.relpath(output, REPO_DIR)} ({seconds:.1f}s)")
+
+    manifest.save()
+    print(f"{len(pending) - failed} rendered, {failed} failed, {len(scenes) - len(pending)} unchanged")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
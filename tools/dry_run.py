@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""
+Construct-only dry run for profiling scene cost.
+
+Runs each scene's `construct` with rasterization and encoding stubbed out,
+while still stepping every animation and updater frame by frame, and reports
+the construct time per scene together with how many mobjects were allocated.
+
+    python tools/dry_run.py 2025_/newton_method.py
+    python tools/dry_run.py 2024_ 2025_ --top 10
+    python tools/dry_run.py 2024_/main.py BezierScene --fps 60
+"""
+
+import argparse
+import collections
+import glob
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import time
+import traceback
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_module(path):
+    """Import a scene file the way `manim <file>` does: by path, with its folder on sys.path."""
+    path = os.path.abspath(path)
+    name = os.path.splitext(os.path.relpath(path, REPO_DIR))[0].replace(os.sep, ".")
+    folder = os.path.dirname(path)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_scenes(module):
+    """Scene subclasses defined in `module`, in source order."""
+    from manim import Scene
+
+    scenes = [
+        obj for obj in vars(module).values()
+        if inspect.isclass(obj) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+    return sorted(scenes, key=lambda cls: inspect.getsourcelines(cls)[1])
+
+
+def expand_paths(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "*.py"), recursive=True)))
+        else:
+            files.append(path)
+    return files
+
+
+class AllocationCounter:
+    """Counts mobjects created (constructed or copied) while active, by class name."""
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self._patched = []
+
+    def __enter__(self):
+        from manim import Mobject
+
+        record = self.record
+        original_init = Mobject.__init__
+        original_copy = Mobject.copy
+
+        def counting_init(mob, *args, **kwargs):
+            record(mob)
+            return original_init(mob, *args, **kwargs)
+
+        def counting_copy(mob, *args, **kwargs):
+            result = original_copy(mob, *args, **kwargs)
+            # a copy duplicates the whole family, not just the root
+            for sub in result.get_family():
+                record(sub)
+            return result
+
+        Mobject.__init__ = counting_init
+        Mobject.copy = counting_copy
+        self._patched = [(Mobject, "__init__", original_init), (Mobject, "copy", original_copy)]
+        return self
+
+    def record(self, mob):
+        self.counts[type(mob).__name__] += 1
+
+    def __exit__(self, *exc):
+        for owner, attr, original in self._patched:
+            setattr(owner, attr, original)
+        self._patched = []
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+
+def stub_renderer(renderer, stats):
+    """
+    Replace the rasterizing/encoding half of a CairoRenderer with no-ops.
+    `renderer.time` (`scene.time`) still advances frame by frame, as in
+    `CairoRenderer.add_frame`, so updaters that read it run as in a render.
+    """
+    from manim import config
+
+    def render(scene, time, moving_mobjects):
+        stats["frames"] += 1
+        renderer.time += 1 / config.frame_rate
+
+    def freeze_current_frame(duration):
+        num_frames = int(duration * config.frame_rate)
+        stats["frames"] += num_frames
+        renderer.time += num_frames / config.frame_rate
+
+    renderer.render = render
+    renderer.update_frame = lambda *args, **kwargs: None
+    renderer.save_static_frame_data = lambda scene, static_mobjects: None
+    renderer.add_frame = lambda *args, **kwargs: None
+    renderer.freeze_current_frame = freeze_current_frame
+    renderer.scene_finished = lambda scene: None
+
+
+def run_scene(scene_cls, hook=None):
+    """
+    Construct `scene_cls` with its renderer stubbed, let `hook(scene)` instrument
+    it, and run it. Returns (scene, stats); an exception raised by the scene is
+    reported in stats["status"] instead of propagating.
+    """
+    stats = {"scene": scene_cls.__name__, "frames": 0}
+    start = time.perf_counter()
+    scene = scene_cls()
+    stub_renderer(scene.renderer, stats)
+    if hook is not None:
+        hook(scene)
+    try:
+        scene.render()
+        stats["status"] = "ok"
+    except Exception as e:
+        stats["status"] = f"error: {type(e).__name__}: {e}"
+        traceback.print_exc()
+    stats["seconds"] = time.perf_counter() - start
+    stats["plays"] = scene.renderer.num_plays
+    return scene, stats
+
+
+def dry_run_scene(scene_cls):
+    """Run one scene without rendering; return a dict of timing and allocation stats."""
+    with AllocationCounter() as allocations:
+        _, stats = run_scene(scene_cls)
+    stats["mobjects"] = allocations.total
+    stats["by_class"] = dict(allocations.counts.most_common())
+    return stats
+
+
+def add_scene_arguments(parser):
+    """The arguments shared by the construct-only tools: paths, --fps and --json."""
+    parser.add_argument("paths", nargs="+",
+                        help="scene files or folders, optionally followed by scene names")
+    parser.add_argument("--fps", type=int, default=15,
+                        help="frame rate used to step animations (default: %(default)s)")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+
+
+def run_scenes(paths, fps, run):
+    """
+    Call `run(scene_cls)` for every scene in `paths` (files or folders, optionally
+    followed by scene names) under the construct-only config. Returns the
+    results, each with the scene's `file` added.
+    """
+    from manim import tempconfig
+
+    files = [p for p in paths if p.endswith(".py") or os.path.isdir(p)]
+    names = set(paths) - set(files)
+
+    results = []
+    overrides = {
+        "dry_run": True,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "frame_rate": fps,
+        "verbosity": "WARNING",
+    }
+    with tempconfig(overrides):
+        for path in expand_paths(files):
+            try:
+                module = load_module(path)
+            except Exception as e:
+                print(f"Skipping {path}: {type(e).__name__}: {e}")
+                continue
+            for scene_cls in find_scenes(module):
+                if names and scene_cls.__name__ not in names:
+                    continue
+                print(f"Running {os.path.relpath(path, REPO_DIR)}::{scene_cls.__name__} ...")
+                results.append(dict(run(scene_cls), file=os.path.relpath(path, REPO_DIR)))
+    return results
+
+
+def save_results(results, json_path):
+    """Write `results` to `json_path` if given; return the exit status (1 if any scene failed)."""
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2, ensure_ascii=False)
+    return 0 if all(r["status"] == "ok" for r in results) else 1
+
+
+def print_report(results, top):
+    print()
+    print(f"{'scene':<32} {'seconds':>9} {'plays':>6} {'frames':>7} {'mobjects':>9}  status")
+    for r in sorted(results, key=lambda r: r["seconds"], reverse=True):
+        print(f"{r['scene']:<32} {r['seconds']:9.3f} {r['plays']:6d} {r['frames']:7d} "
+              f"{r['mobjects']:9d}  {r['status']}")
+        if top:
+            common = list(r["by_class"].items())[:top]
+            print("    " + ", ".join(f"{name}={count}" for name, count in common))
+    print(f"{'total':<32} {sum(r['seconds'] for r in results):9.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_scene_arguments(parser)
+    parser.add_argument("--top", type=int, default=5,
+                        help="show the N most allocated mobject classes per scene")
+    args = parser.parse_args(argv)
+
+    results = run_scenes(args.paths, args.fps, dry_run_scene)
+    if not results:
+        print("No scenes found")
+        return 1
+
+    print_report(results, args.top)
+    return save_results(results, args.json_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+"""
+Managed media directory: manifest, AppleDouble quarantine and size-capped GC.
+
+Every file under the media directory is recorded in `media_manifest.json`
+with its size, modification time, kind and the scene it belongs to:
+
+    output   final videos and last-frame images (videos/, images/)
+    partial  Manim's partial movie files, one per play call
+    build    videos stored by tools/build.py (build/<hash>/)
+    cache    Tex, texts, text_atlas and grid_cache entries
+    other    anything else
+    quarantine  AppleDouble files moved aside (see below)
+
+macOS writes AppleDouble `._*` companions on external volumes, and Manim
+trips over them when it lists partial movie files. Scanning moves them to
+`.quarantine/` (mirroring their path) instead of deleting them blindly.
+
+`gc` trims the directory to a size cap, least recently used first:
+quarantined files, then partial files, then caches, then build outputs no scene points at any more, then
+final videos; within each, scenes whose newest file is oldest go first.
+Build outputs the build manifest still points at are never removed.
+
+    python tools/media_store.py usage
+    python tools/media_store.py gc --max-size 5G --dry-run
+    python tools/media_store.py quarantine --purge
+"""
+
+import argparse
+import collections
+import json
+import os
+import shutil
+import sys
+import time
+from typing import NamedTuple
+
+from dry_run import REPO_DIR
+
+DEFAULT_MEDIA = os.path.join(REPO_DIR, "media")
+MANIFEST = "media_manifest.json"
+QUARANTINE = ".quarantine"
+APPLEDOUBLE_PREFIX = "._"
+CACHE_DIRS = ("Tex", "texts", "text_atlas", "grid_cache")
+# eviction order: intermediates go first
+TIERS = {"quarantine": 0, "partial": 1, "cache": 2, "build": 3, "other": 4, "output": 5}
+UNITS = {"k": 2 ** 10, "m": 2 ** 20, "g": 2 ** 30, "t": 2 ** 40}
+
+
+class Entry(NamedTuple):
+    path: str  # relative to the media directory
+    size: int
+    mtime: float
+    kind: str
+    scene: str
+
+
+def parse_size(text):
+    """Bytes from '750M', '5G', '5GB' or a plain number."""
+    text = text.strip().lower().rstrip("b")
+    if text and text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def human(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def scene_labels():
+    """{(module stem, scene name): 'file.py::Scene'} for every scene in the repository."""
+    from scenes import discover
+
+    return {
+        (os.path.splitext(os.path.basename(info.path))[0], info.name): info.selector
+        for info in discover()
+    }
+
+
+class MediaStore:
+    def __init__(self, media_dir=DEFAULT_MEDIA):
+        self.media_dir = os.path.abspath(media_dir)
+        self.manifest_path = os.path.join(self.media_dir, MANIFEST)
+        self.quarantine_dir = os.path.join(self.media_dir, QUARANTINE)
+        self.entries = {}
+        self._labels = None
+
+    def label(self, module, scene):
+        if self._labels is None:
+            self._labels = scene_labels()
+        return self._labels.get((module, scene), f"{module}::{scene}")
+
+    def build_references(self):
+        """{path relative to the media dir: selector} for the outputs tools/build.py currently uses."""
+        path = os.path.join(self.media_dir, "build", "manifest.json")
+        try:
+            with open(path, encoding="utf-8") as fp:
+                entries = json.load(fp)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return {os.path.join("build", entry["output"]): selector for selector, entry in entries.items()}
+
+    def classify(self, relative, references):
+        """(kind, scene) of a file from where Manim and the tools put it."""
+        parts = relative.split(os.sep)
+        top, stem = parts[0], os.path.splitext(parts[-1])[0]
+        if top == "videos" and len(parts) >= 3:
+            module = parts[1]
+            if "partial_movie_files" in parts:
+                index = parts.index("partial_movie_files")
+                scene = parts[index + 1] if len(parts) > index + 2 else "?"
+                return "partial", self.label(module, scene)
+            return "output", self.label(module, stem)
+        if top == "images" and len(parts) >= 3:
+            # last frames are saved as <Scene>_ManimCE_v<version>.png
+            return "output", self.label(parts[1], stem.split("_ManimCE")[0])
+        if top == "build" and len(parts) >= 3:
+            return "build", references.get(relative, f"{stem} (unreferenced build)")
+        if top == QUARANTINE:
+            return "quarantine", "(quarantine)"
+        if top in CACHE_DIRS:
+            return "cache", f"({top})"
+        return "other", f"({top})"
+
+    def scan(self, quarantine=True, save=True):
+        """
+        Walk the media directory and (optionally) quarantine AppleDouble files
+        and write the manifest. The quarantine is walked last, so files moved
+        there by this scan are counted too.
+        """
+        references = self.build_references()
+        entries = {}
+        moved = []
+        for folder, dirs, files in os.walk(self.media_dir):
+            if folder == self.media_dir:
+                dirs[:] = [d for d in dirs if d != QUARANTINE]
+            for name in files:
+                path = os.path.join(folder, name)
+                relative = os.path.relpath(path, self.media_dir)
+                if name.startswith(APPLEDOUBLE_PREFIX):
+                    if quarantine:
+                        self._quarantine(path, relative)
+                        moved.append(relative)
+                    continue
+                if relative == MANIFEST or name == ".DS_Store":
+                    continue
+                self._record(entries, path, relative, references)
+        for folder, _, files in os.walk(self.quarantine_dir):
+            for name in files:
+                path = os.path.join(folder, name)
+                self._record(entries, path, os.path.relpath(path, self.media_dir), references)
+        self.entries = entries
+        if save:
+            self.save()
+        return moved
+
+    def _record(self, entries, path, relative, references):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return  # removed while scanning (a render cleaning up)
+        kind, scene = self.classify(relative, references)
+        entries[relative] = Entry(relative, stat.st_size, stat.st_mtime, kind, scene)
+
+    def _quarantine(self, path, relative):
+        target = os.path.join(self.quarantine_dir, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+
+    def purge_quarantine(self):
+        size = sum(os.path.getsize(os.path.join(folder, name))
+                   for folder, _, files in os.walk(self.quarantine_dir) for name in files)
+        shutil.rmtree(self.quarantine_dir, ignore_errors=True)
+        self.entries = {path: entry for path, entry in self.entries.items() if entry.kind != "quarantine"}
+        self.save()
+        return size
+
+    def save(self):
+        if not os.path.isdir(self.media_dir):
+            return
+        data = {
+            "scanned": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "total": self.total(),
+            "entries": {path: entry._asdict() for path, entry in sorted(self.entries.items())},
+        }
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, indent=1, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def total(self):
+        return sum(entry.size for entry in self.entries.values())
+
+    def usage(self):
+        """{scene: {kind: bytes, 'files': n}}, largest scenes first."""
+        report = collections.defaultdict(collections.Counter)
+        for entry in self.entries.values():
+            report[entry.scene][entry.kind] += entry.size
+            report[entry.scene]["files"] += 1
+        return dict(sorted(report.items(), key=lambda item: -sum(
+            size for kind, size in item[1].items() if kind != "files")))
+
+    def eviction_order(self):
+        """Evictable entries, first to go first."""
+        protected = set(self.build_references()) | {os.path.join("build", "manifest.json")}
+        last_used = collections.defaultdict(float)
+        for entry in self.entries.values():
+            last_used[entry.scene] = max(last_used[entry.scene], entry.mtime)
+        candidates = [entry for entry in self.entries.values() if entry.path not in protected]
+        return sorted(candidates, key=lambda e: (TIERS[e.kind], last_used[e.scene], e.mtime))
+
+    def gc(self, max_size, dry_run=False):
+        """Remove least recently used entries until the store fits in `max_size` bytes; return them."""
+        total = self.total()
+        removed = []
+        for entry in self.eviction_order():
+            if total <= max_size:
+                break
+            if not dry_run:
+                path = os.path.join(self.media_dir, entry.path)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                self._remove_empty_parents(os.path.dirname(path))
+                del self.entries[entry.path]
+            total -= entry.size
+            removed.append(entry)
+        if not dry_run:
+            self.save()
+        return removed
+
+    def _remove_empty_parents(self, folder):
+        while folder != self.media_dir and folder.startswith(self.media_dir):
+            try:
+                os.rmdir(folder)
+            except OSError:
+                return
+            folder = os.path.dirname(folder)
+
+
+def print_usage(store, top):
+    kinds = ("output", "partial", "build", "cache", "other", "quarantine")
+    print(f"{'scene':<64} " + " ".join(f"{kind:>10}" for kind in kinds) + f" {'files':>6}")
+    for n, (scene, sizes) in enumerate(store.usage().items()):
+        if top and n == top:
+            break
+        print(f"{scene:<64} " + " ".join(f"{human(sizes[kind]) if sizes[kind] else '-':>10}" for kind in kinds)
+              + f" {sizes['files']:6d}")
+    print(f"{'total':<64} {human(store.total()):>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--media-dir", default=DEFAULT_MEDIA, help="media directory (default: media)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    usage_parser = commands.add_parser("usage", help="disk usage per scene")
+    usage_parser.add_argument("--top", type=int, default=0, help="only the N largest scenes")
+
+    gc_parser = commands.add_parser("gc", help="quarantine AppleDouble files and trim to a size cap")
+    gc_parser.add_argument("--max-size", type=parse_size, default=parse_size("10G"),
+                           help="size cap, e.g. 750M or 5G (default: 10G)")
+    gc_parser.add_argument("--dry-run", action="store_true", help="only list what would be removed")
+    gc_parser.add_argument("--quiet", action="store_true", help="only print the summary")
+
+    quarantine_parser = commands.add_parser("quarantine", help="move AppleDouble `._*` files aside")
+    quarantine_parser.add_argument("--purge", action="store_true", help="then delete the quarantine")
+    args = parser.parse_args(argv)
+
+    store = MediaStore(args.media_dir)
+    if not os.path.isdir(store.media_dir):
+        print(f"No media directory at {store.media_dir}")
+        return 0
+
+    if args.command == "usage":
+        store.scan(quarantine=False)
+        print_usage(store, args.top)
+        return 0
+
+    # a dry run changes nothing on disk, the manifest included
+    dry_run = getattr(args, "dry_run", False)
+    moved = store.scan(quarantine=not dry_run, save=not dry_run)
+    if moved:
+        print(f"Quarantined {len(moved)} AppleDouble files in {os.path.relpath(store.quarantine_dir)}")
+
+    if args.command == "quarantine":
+        if args.purge:
+            print(f"Purged {human(store.purge_quarantine())} of quarantined files")
+        return 0
+
+    before = store.total()
+    removed = store.gc(args.max_size, args.dry_run)
+    if not args.quiet:
+        for entry in removed:
+            print(f"{'would remove' if args.dry_run else 'removed':<12} {human(entry.size):>9}  {entry.path}")
+    freed = sum(entry.size for entry in removed)
+    print(f"{human(before)} -> {human(before - freed)} (cap {human(args.max_size)}), "
+          f"{len(removed)} files {'would be ' if args.dry_run else ''}removed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
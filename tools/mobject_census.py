@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+"""
+Mobject lifetime census after every play/wait.
+
+Runs scenes construct-only like dry_run.py and, after each `play` or `wait`,
+garbage-collects and records how many mobjects are alive, how many bytes
+their point arrays hold, how deep the scene graph is and the process RSS.
+Live mobjects are split by what keeps them alive:
+
+    in_scene  reachable from scene.mobjects (or the camera frame)
+    locals    reachable from locals of construct and the helpers it calls
+    anim      held by the animations of the last play
+    other     none of the above: caches, globals, closures, leaks
+
+A growing `other` column is what to look at first; the report ends with the
+classes still in `other` and, for a few of them, what refers to them.
+
+    python tools/mobject_census.py 2024_/main.py BezierScene
+    python tools/mobject_census.py 2025_ --quiet --json census.json
+"""
+
+import argparse
+import gc
+import os
+import resource
+import sys
+import types
+import weakref
+
+from dry_run import AllocationCounter, add_scene_arguments, run_scene, run_scenes, save_results
+
+CATEGORIES = ("in_scene", "locals", "anim", "other")
+
+
+class LiveMobjects(AllocationCounter):
+    """AllocationCounter that also keeps a weak reference to every mobject it sees."""
+
+    def __init__(self):
+        super().__init__()
+        self.live = weakref.WeakSet()
+
+    def record(self, mob):
+        super().record(mob)
+        self.live.add(mob)
+
+
+def rss_bytes():
+    """Current resident set size, or the peak where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def walk(roots, seen):
+    """Add the ids of every mobject under `roots` to `seen`; return the deepest level reached."""
+    from manim import Mobject
+
+    deepest = 0
+    stack = [(mob, 1) for mob in roots if isinstance(mob, Mobject)]
+    while stack:
+        mob, depth = stack.pop()
+        if id(mob) in seen:
+            continue
+        seen.add(id(mob))
+        deepest = max(deepest, depth)
+        stack.extend((sub, depth + 1) for sub in mob.submobjects)
+    return deepest
+
+
+def mobjects_in(values):
+    """Mobjects among `values`, looking one level into lists, tuples, sets and dicts."""
+    from manim import Mobject
+
+    found = []
+    for value in values:
+        if isinstance(value, Mobject):
+            found.append(value)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            found.extend(v for v in value if isinstance(v, Mobject))
+        elif isinstance(value, dict):
+            found.extend(v for v in value.values() if isinstance(v, Mobject))
+    return found
+
+
+def scene_locals(scene):
+    """Mobjects held in locals of every active frame whose `self` is the scene."""
+    found = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_locals.get("self") is scene:
+            found.extend(mobjects_in(frame.f_locals.values()))
+        frame = frame.f_back
+    return found
+
+
+def animation_mobjects(scene):
+    found = []
+    for animation in getattr(scene, "animations", None) or []:
+        found.extend(mobjects_in(vars(animation).values()))
+    return found
+
+
+def key_of(mapping, value, default="?"):
+    for key, item in mapping.items():
+        if item is value:
+            return key
+    return default
+
+
+def describe_holder(mob, ignore=()):
+    """One-level guess at what keeps `mob` alive, for the report."""
+    from manim import Mobject
+
+    modules = {id(vars(m)): (name, vars(m)) for name, m in list(sys.modules.items()) if m is not None}
+
+    def global_name(container):
+        for referrer in gc.get_referrers(container):
+            if id(referrer) in modules:
+                name, namespace = modules[id(referrer)]
+                return f"global {name}.{key_of(namespace, container)}"
+        return None
+
+    for referrer in gc.get_referrers(mob):
+        if id(referrer) in ignore or isinstance(referrer, types.FrameType):
+            continue
+        if isinstance(referrer, dict):
+            key = key_of(referrer, mob)
+            if id(referrer) in modules:
+                return f"global {modules[id(referrer)][0]}.{key}"
+            for owner in gc.get_referrers(referrer):
+                if getattr(owner, "__dict__", None) is referrer and not isinstance(owner, type):
+                    return f"attribute {type(owner).__name__}.{key}"
+            return global_name(referrer) or f"dict[{key!r}]"
+        if isinstance(referrer, list):
+            for owner in gc.get_referrers(referrer):
+                if isinstance(owner, Mobject) and owner.submobjects is referrer:
+                    return f"submobject of {type(owner).__name__}"
+            return global_name(referrer) or "list"
+        # instances whose __dict__ was never materialized show up as the referrer themselves
+        attributes = getattr(referrer, "__dict__", None)
+        if isinstance(attributes, dict) and not isinstance(referrer, (type, types.ModuleType)):
+            key = key_of(attributes, mob, None)
+            if key is not None:
+                return f"attribute {type(referrer).__name__}.{key}"
+        return type(referrer).__name__
+    return "unknown"
+
+
+class Census:
+    """Snapshots of the live mobjects after each play/wait of one scene."""
+
+    def __init__(self, scene, tracker, collect=True):
+        self.scene = scene
+        self.tracker = tracker
+        self.collect = collect
+        self.steps = []
+
+    def label(self, args):
+        from manim import Wait
+
+        if len(args) == 1 and isinstance(args[0], Wait):
+            return "wait"
+        names = [type(a).__name__.lstrip("_").replace("AnimationBuilder", "animate") for a in args]
+        return ",".join(names)[:40]
+
+    def classify(self):
+        """(category per live mobject id, scene-graph depth)."""
+        scene = self.scene
+        roots = list(scene.mobjects)
+        frame = getattr(scene.renderer.camera, "frame", None)
+        if frame is not None:
+            roots.append(frame)
+
+        categories = {}
+        depth = 0
+        seen = set()
+        for category, found in (("in_scene", roots), ("locals", scene_locals(scene)),
+                                ("anim", animation_mobjects(scene))):
+            before = set(seen)
+            reached = walk(found, seen)
+            if category == "in_scene":
+                depth = reached
+            categories.update(dict.fromkeys(seen - before, category))
+        return categories, depth
+
+    def snapshot(self, call):
+        if self.collect:
+            gc.collect()
+        live = list(self.tracker.live)
+        categories, depth = self.classify()
+        step = dict.fromkeys(CATEGORIES, 0)
+        step.update(call=call, time=self.scene.renderer.time, live=len(live), depth=depth,
+                    point_bytes=0, other_bytes=0, rss=rss_bytes())
+        for mob in live:
+            category = categories.get(id(mob), "other")
+            step[category] += 1
+            nbytes = getattr(mob.points, "nbytes", 0)
+            step["point_bytes"] += nbytes
+            if category == "other":
+                step["other_bytes"] += nbytes
+        self.steps.append(step)
+        return step
+
+    def hook(self):
+        """Snapshot after every renderer.play, which both Scene.play and Scene.wait go through."""
+        renderer = self.scene.renderer
+        original_play = renderer.play
+
+        def play(scene, *args, **kwargs):
+            result = original_play(scene, *args, **kwargs)
+            self.snapshot(self.label(args))
+            return result
+
+        renderer.play = play
+
+    def leftovers(self, samples=3):
+        """Mobjects still in `other`, by class: (count, point bytes, distinct holders of the first few)."""
+        gc.collect()
+        categories, _ = self.classify()
+        others = [mob for mob in list(self.tracker.live) if categories.get(id(mob), "other") == "other"]
+        by_class = {}
+        for mob in others:
+            entry = by_class.setdefault(type(mob).__name__, [0, 0, []])
+            entry[0] += 1
+            entry[1] += getattr(mob.points, "nbytes", 0)
+            if entry[0] <= samples:
+                holder = describe_holder(mob, ignore={id(others)})
+                if holder not in entry[2]:
+                    entry[2].append(holder)
+        return sorted(by_class.items(), key=lambda item: item[1][1], reverse=True)
+
+
+def census_scene(scene_cls, collect=True):
+    """Run one scene without rendering; return its stats dict with a snapshot per play/wait."""
+    with LiveMobjects() as tracker:
+        censuses = []
+
+        def install(scene):
+            census = Census(scene, tracker, collect)
+            census.hook()
+            censuses.append(census)
+
+        _, stats = run_scene(scene_cls, install)
+        census = censuses[0]
+        # construct has returned, so its locals are gone: whatever is not in the scene now is held elsewhere
+        census.snapshot("end")
+        stats["leftovers"] = [
+            {"class": name, "count": count, "point_bytes": nbytes, "held_by": holders}
+            for name, (count, nbytes, holders) in census.leftovers()
+        ]
+    stats["mobjects"] = tracker.total
+    stats["steps"] = census.steps
+    return stats
+
+
+def megabytes(n):
+    return n / 2 ** 20
+
+
+def print_report(result, quiet, top):
+    steps = result["steps"]
+    if not quiet:
+        print(f"{'#':>4} {'call':<28} {'t':>7} {'live':>7} {'scene':>6} {'locals':>6} {'anim':>5} "
+              f"{'other':>6} {'pts MB':>7} {'depth':>5} {'RSS MB':>7}")
+        for n, s in enumerate(steps):
+            print(f"{n:4d} {s['call']:<28} {s['time']:7.2f} {s['live']:7d} {s['in_scene']:6d} "
+                  f"{s['locals']:6d} {s['anim']:5d} {s['other']:6d} {megabytes(s['point_bytes']):7.2f} "
+                  f"{s['depth']:5d} {megabytes(s['rss']):7.1f}")
+
+    if steps:
+        peak_live = max(range(len(steps)), key=lambda n: steps[n]["live"])
+        peak_bytes = max(range(len(steps)), key=lambda n: steps[n]["point_bytes"])
+        peak_rss = max(range(len(steps)), key=lambda n: steps[n]["rss"])
+        print(f"{result['scene']}: {result['mobjects']} mobjects created, "
+              f"peak {steps[peak_live]['live']} live at #{peak_live}, "
+              f"peak {megabytes(steps[peak_bytes]['point_bytes']):.2f} MB of points at #{peak_bytes}, "
+              f"peak RSS {megabytes(steps[peak_rss]['rss']):.1f} MB at #{peak_rss}")
+        grew = sum(b["other"] > a["other"] for a, b in zip(steps, steps[1:]))
+        if len(steps) > 2 and grew > (len(steps) - 1) / 2:
+            print(f"  warning: `other` grew after {grew} of {len(steps) - 1} calls")
+
+    for entry in result["leftovers"][:top]:
+        print(f"  other: {entry['class']:<20} {entry['count']:6d} objects "
+              f"{megabytes(entry['point_bytes']):8.2f} MB  held by {', '.join(entry['held_by'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_scene_arguments(parser)
+    parser.add_argument("--top", type=int, default=10,
+                        help="list the N largest classes left in `other` per scene")
+    parser.add_argument("--quiet", action="store_true", help="only print the per-scene summary")
+    parser.add_argument("--no-gc", dest="collect", action="store_false",
+                        help="skip gc.collect() before each snapshot (faster, counts garbage cycles as live)")
+    args = parser.parse_args(argv)
+
+    def run(scene_cls):
+        result = census_scene(scene_cls, args.collect)
+        print_report(result, args.quiet, args.top)
+        return result
+
+    results = run_scenes(args.paths, args.fps, run)
+    if not results:
+        print("No scenes found")
+        return 1
+    return save_results(results, args.json_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
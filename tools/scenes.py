@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""
+Scene discovery without importing Manim.
+
+Scene classes are found by parsing the source files: a class is a scene if
+one of its bases is a Manim `*Scene` class or another scene class, followed
+through local `from module import Name` imports. Listing and inspecting
+scenes never imports Manim or the scene modules; `render` imports only the
+one module it renders, right before rendering it.
+
+    python tools/scenes.py list
+    python tools/scenes.py list 2024_ --json
+    python tools/scenes.py info BezierInterpolationScene
+    python tools/scenes.py info 2024_/episode_2.py::BezierScene
+    python tools/scenes.py render 2024_/interpolation.py::BezierInterpolationScene -q m -p
+
+Orchestrators can use `discover()` and `load_scene()` the same way, so
+workers import only the modules they actually render.
+"""
+
+import argparse
+import ast
+import functools
+import json
+import os
+import sys
+from typing import NamedTuple
+
+from dry_run import REPO_DIR, expand_paths, load_module
+
+# Manim quality flags, as in `manim -q`
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+class SceneInfo(NamedTuple):
+    path: str
+    name: str
+    line: int
+    end_line: int
+    bases: tuple
+    doc: str
+
+    @property
+    def selector(self):
+        return f"{os.path.relpath(self.path, REPO_DIR)}::{self.name}"
+
+
+def default_paths():
+    """The year folders (2024_/, 2025_/, ...) at the top of the repository."""
+    return sorted(
+        os.path.join(REPO_DIR, name) for name in os.listdir(REPO_DIR)
+        if name[:2] == "20" and os.path.isdir(os.path.join(REPO_DIR, name))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def parse(path):
+    """AST of a source file, parsed once per process; None if it does not parse."""
+    try:
+        with open(path, encoding="utf-8") as fp:
+            return ast.parse(fp.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+def resolve_module(name, folder):
+    """Path of local module `name` as seen from a file in `folder`: the folder itself, then its parents."""
+    relative = name.replace(".", os.sep) + ".py"
+    while True:
+        candidate = os.path.join(folder, relative)
+        if os.path.isfile(candidate):
+            return candidate
+        if os.path.samefile(folder, REPO_DIR) or os.path.dirname(folder) == folder:
+            return None
+        folder = os.path.dirname(folder)
+
+
+def local_imports(path):
+    """{imported name or module: local file} for every import of a repository module in `path`."""
+    tree = parse(path)
+    if tree is None:
+        return {}
+    folder = os.path.dirname(os.path.abspath(path))
+    found = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            target = resolve_module(node.module, folder)
+            if target:
+                for alias in node.names:
+                    found[alias.asname or alias.name] = target
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                target = resolve_module(alias.name, folder)
+                if target:
+                    found[alias.asname or alias.name] = target
+    return found
+
+
+def base_name(node):
+    """`Scene` for both `Scene` and `manim.Scene` bases; None for anything else."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def classes(path):
+    tree = parse(path)
+    return [node for node in tree.body if isinstance(node, ast.ClassDef)] if tree else []
+
+
+def is_scene_class(path, name, _seen=None):
+    """Whether class `name` in `path` derives from a Manim scene, following local classes and imports."""
+    seen = set() if _seen is None else _seen
+    if (path, name) in seen:
+        return False
+    seen.add((path, name))
+
+    for node in classes(path):
+        if node.name == name:
+            return any(is_scene_base(path, base_name(base), seen) for base in node.bases)
+    imported = local_imports(path).get(name)
+    return bool(imported) and is_scene_class(imported, name, seen)
+
+
+def is_scene_base(path, name, seen):
+    if not name:
+        return False
+    if any(node.name == name for node in classes(path)) or name in local_imports(path):
+        return is_scene_class(path, name, seen)
+    # anything else comes from `from manim import *`: Scene, MovingCameraScene, ThreeDScene, ...
+    return name.endswith("Scene")
+
+
+def scan_file(path):
+    path = os.path.abspath(path)
+    scenes = []
+    for node in classes(path):
+        if is_scene_class(path, node.name):
+            scenes.append(SceneInfo(
+                path=path,
+                name=node.name,
+                line=node.lineno,
+                end_line=node.end_lineno,
+                bases=tuple(ast.unparse(base) for base in node.bases),
+                doc=ast.get_docstring(node) or "",
+            ))
+    return scenes
+
+
+def discover(paths=None):
+    """SceneInfo for every scene class under `paths` (files or folders), in file and source order."""
+    scenes = []
+    for path in expand_paths(paths or default_paths()):
+        scenes.extend(scan_file(path))
+    return scenes
+
+
+def select(selector, paths=None):
+    """
+    Scenes matching `selector`: `Name`, `file.py` or `file.py::Name`.
+    A bare name is looked up in `paths` (the year folders by default).
+    """
+    file_part, _, name = selector.rpartition("::") if "::" in selector else ("", "", selector)
+    if not file_part and selector.endswith(".py"):
+        file_part, name = selector, ""
+    if file_part:
+        # relative to the working directory, or else to the repository root
+        scenes = scan_file(file_part if os.path.exists(file_part) else os.path.join(REPO_DIR, file_part))
+    else:
+        scenes = discover(paths)
+    return [scene for scene in scenes if not name or scene.name == name]
+
+
+def load_scene(info):
+    """Import the scene's module (and Manim) now, and return the scene class."""
+    return getattr(load_module(info.path), info.name)
+
+
+def render(info, quality="l", preview=False, media_dir=None, **overrides):
+    """Render one scene in this process, importing only its module."""
+    from manim import tempconfig
+
+    options = {"quality": QUALITIES[quality], "input_file": info.path, **overrides}
+    if media_dir:
+        options["media_dir"] = media_dir
+    with tempconfig(options):
+        scene = load_scene(info)()
+        scene.render(preview=preview)
+    return scene
+
+
+def first_line(text):
+    return text.strip().splitlines()[0] if text.strip() else ""
+
+
+def pick_one(selector, paths):
+    scenes = select(selector, paths)
+    if len(scenes) != 1:
+        if not scenes:
+            print(f"No scene matches {selector!r}")
+        else:
+            print(f"{selector!r} is ambiguous, use one of:")
+            for scene in scenes:
+                print(f"  {scene.selector}")
+        return None
+    return scenes[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="list scene classes")
+    list_parser.add_argument("paths", nargs="*", help="files or folders (default: the year folders)")
+    list_parser.add_argument("--json", action="store_true", help="print the scenes as JSON")
+
+    info_parser = commands.add_parser("info", help="show one scene's location, bases, docstring and local imports")
+    info_parser.add_argument("selector", help="Name, file.py or file.py::Name")
+
+    render_parser = commands.add_parser("render", help="render one scene, importing only its module")
+    render_parser.add_argument("selector", help="Name or file.py::Name")
+    render_parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l",
+                               help="render quality as in `manim -q` (default: %(default)s)")
+    render_parser.add_argument("-p", "--preview", action="store_true", help="open the video when done")
+    render_parser.add_argument("--media-dir", help="media directory (default: Manim's)")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        scenes = discover(args.paths)
+        if args.json:
+            print(json.dumps([dict(s._asdict(), path=os.path.relpath(s.path, REPO_DIR)) for s in scenes],
+                             indent=2, ensure_ascii=False))
+        else:
+            width = max((len(s.selector) for s in scenes), default=0)
+            for scene in scenes:
+                print(f"{scene.selector:<{width}}  {first_line(scene.doc)}".rstrip())
+        return 0 if scenes else 1
+
+    if args.command == "info":
+        scenes = select(args.selector)
+        for scene in scenes:
+            print(scene.selector)
+            print(f"  lines   {scene.line}-{scene.end_line}")
+            print(f"  bases   {', '.join(scene.bases)}")
+            imports = sorted(set(local_imports(scene.path).values()))
+            if imports:
+                print(f"  imports {', '.join(os.path.relpath(p, REPO_DIR) for p in imports)}")
+            if scene.doc:
+                print("\n".join("  | " + line for line in scene.doc.splitlines()))
+        if not scenes:
+            print(f"No scene matches {args.selector!r}")
+        return 0 if scenes else 1
+
+    scene = pick_one(args.selector, None)
+    if scene is None:
+        return 1
+    print(f"Rendering {scene.selector} ...")
+    render(scene, args.quality, args.preview, args.media_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())